@@ -0,0 +1,278 @@
+import atexit
+import json
+import os
+import threading
+import time
+from contextlib import contextmanager
+
+from selenium import webdriver
+from selenium.common.exceptions import WebDriverException
+from selenium.webdriver.common.driver_finder import DriverFinder
+
+try:
+    import fcntl
+except ImportError:  # Windows: profile slots are not locked between processes
+    fcntl = None
+
+# Pool settings (override with environment variables)
+POOL_SIZE = int(os.environ.get("CASE_DRIVER_POOL_SIZE", "1"))  # warm browsers kept per process
+MAX_PAGES_PER_DRIVER = int(os.environ.get("CASE_DRIVER_MAX_PAGES", "25"))  # recycle after this many pages
+
+# Lean scraping profile: no images, media, fonts or third-party scripts, eager page loads
+# (CASE_LEAN_PROFILE=0 restores the full profile)
+LEAN_PROFILE = os.environ.get("CASE_LEAN_PROFILE", "1") != "0"
+
+# Browser bootstrap cache: the chromedriver/Chrome paths found by Selenium Manager are kept
+# across runs (CASE_DRIVER_CACHE=0 resolves them every time). CASE_PROFILE_DIR optionally
+# keeps a persistent user-data-dir per pool slot, so Chrome's HTTP cache survives runs.
+DRIVER_CACHE = os.environ.get("CASE_DRIVER_CACHE", "1") != "0"
+CACHE_DIR = os.path.join(os.environ.get("XDG_CACHE_HOME") or os.path.join(os.path.expanduser("~"), ".cache"), "heavy_machines")
+DRIVER_CACHE_PATH = os.path.join(CACHE_DIR, "chromedriver.json")
+PROFILE_DIR = os.environ.get("CASE_PROFILE_DIR")
+MAX_PROFILE_SLOTS = 32
+
+BLOCKED_URL_PATTERNS = [
+    # Images, fonts and media
+    "*.png*", "*.jpg*", "*.jpeg*", "*.gif*", "*.webp*", "*.avif*", "*.svg*", "*.ico*",
+    "*.woff*", "*.ttf*", "*.otf*", "*.eot*",
+    "*.mp4*", "*.webm*", "*.m3u8*", "*.mp3*",
+    # Analytics, tag managers, consent banners and embeds
+    "*googletagmanager.com*", "*google-analytics.com*", "*doubleclick.net*", "*googleadservices.com*",
+    "*adobedtm.com*", "*demdex.net*", "*omtrdc.net*", "*facebook.net*", "*facebook.com*",
+    "*linkedin.com*", "*licdn.com*", "*hotjar.com*", "*cookielaw.org*", "*onetrust.com*",
+    "*youtube.com*", "*ytimg.com*", "*vimeo.com*",
+]
+
+
+def load_driver_paths():
+    """Returns the cached {"driver_path", "browser_path"}, or None if missing or stale."""
+    if not DRIVER_CACHE:
+        return None
+    try:
+        with open(DRIVER_CACHE_PATH, encoding="utf-8") as f:
+            paths = json.load(f)
+    except (OSError, ValueError):
+        return None
+    if not os.path.isfile(paths.get("driver_path", "")):
+        return None
+    if paths.get("browser_path") and not os.path.isfile(paths["browser_path"]):
+        return None
+    return paths
+
+
+def resolve_driver_paths(options):
+    """Runs Selenium Manager to locate chromedriver and Chrome, and caches the result."""
+    finder = DriverFinder(webdriver.ChromeService(), options)
+    paths = {"driver_path": finder.get_driver_path(), "browser_path": finder.get_browser_path()}
+    if DRIVER_CACHE:
+        os.makedirs(CACHE_DIR, exist_ok=True)
+        tmp_path = f"{DRIVER_CACHE_PATH}.{os.getpid()}.tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(paths, f)
+        os.replace(tmp_path, DRIVER_CACHE_PATH)
+    return paths
+
+
+def forget_driver_paths():
+    try:
+        os.remove(DRIVER_CACHE_PATH)
+    except OSError:
+        pass
+
+
+def claim_profile_slot(root):
+    """Locks the first free <root>/slot-N user-data-dir; returns (path, lock file) or (None, None).
+
+    Chrome refuses to share a user-data-dir, so every live browser (in any process) gets
+    its own slot; the lock is released when the lock file is closed.
+    """
+    os.makedirs(root, exist_ok=True)
+    for slot in range(MAX_PROFILE_SLOTS):
+        path = os.path.join(root, f"slot-{slot}")
+        lock = open(f"{path}.lock", "a")
+        if fcntl is not None:
+            try:
+                fcntl.flock(lock, fcntl.LOCK_EX | fcntl.LOCK_NB)
+            except OSError:
+                lock.close()
+                continue
+        os.makedirs(path, exist_ok=True)
+        return path, lock
+    print(f"All {MAX_PROFILE_SLOTS} profile slots in {root} are busy; using a temporary profile")
+    return None, None
+
+
+def setup_driver(lean=None, profile_dir=None):
+    """Starts headless Chrome; with the lean profile heavy resources are never downloaded.
+
+    The chromedriver path comes from the bootstrap cache when possible, and profile_dir
+    (if given) is used as a persistent user-data-dir. Startup time is printed.
+    """
+    if lean is None:
+        lean = LEAN_PROFILE
+    options = webdriver.ChromeOptions()
+    options.add_argument("--headless")  # Run in headless mode
+    options.add_argument("--disable-gpu")
+    options.add_argument("--no-sandbox")
+    if lean:
+        options.page_load_strategy = "eager"  # return at DOMContentLoaded; waits key on the spec table
+        options.add_argument("--blink-settings=imagesEnabled=false")
+        options.add_argument("--autoplay-policy=user-gesture-required")
+        options.add_experimental_option("prefs", {
+            "profile.managed_default_content_settings.images": 2,
+            "profile.default_content_setting_values.notifications": 2,
+        })
+    if profile_dir:
+        options.add_argument(f"--user-data-dir={os.path.abspath(profile_dir)}")
+
+    start = time.perf_counter()
+    paths = load_driver_paths()
+    cached = paths is not None
+    if not cached:
+        paths = resolve_driver_paths(options)
+    try:
+        driver = _start_chrome(options, paths)
+    except WebDriverException:
+        if not cached:
+            raise
+        # Chrome or chromedriver was updated since the paths were cached
+        forget_driver_paths()
+        cached = False
+        driver = _start_chrome(options, resolve_driver_paths(options))
+    print(f"Chrome started in {time.perf_counter() - start:.1f}s "
+          f"({'cached' if cached else 'resolved'} chromedriver, {'persistent' if profile_dir else 'fresh'} profile)")
+    if lean:
+        block_heavy_resources(driver)
+    return driver
+
+
+def _start_chrome(options, paths):
+    if paths.get("browser_path"):
+        options.binary_location = paths["browser_path"]
+    service = webdriver.ChromeService(executable_path=paths["driver_path"])
+    return webdriver.Chrome(service=service, options=options)
+
+
+def open_tab(driver):
+    """Opens a new tab and switches to it, blocking the same resources as the first tab."""
+    driver.switch_to.new_window("tab")
+    if LEAN_PROFILE:
+        block_heavy_resources(driver)
+
+
+def block_heavy_resources(driver):
+    """Blocks BLOCKED_URL_PATTERNS in the current tab through the DevTools protocol."""
+    driver.execute_cdp_cmd("Network.enable", {})
+    driver.execute_cdp_cmd("Network.setBlockedURLs", {"urls": BLOCKED_URL_PATTERNS})
+
+
+class DriverPool:
+    """Keeps warm headless Chrome instances for reuse across models and CASE scripts.
+
+    A driver is handed out by acquire() and returned by release(); after max_pages
+    page loads it is quit and replaced on demand, so Chrome memory growth does not pile up.
+    """
+
+    def __init__(self, size=POOL_SIZE, max_pages=MAX_PAGES_PER_DRIVER):
+        self.size = max(1, size)
+        self.max_pages = max(1, max_pages)
+        self._idle = []
+        self._pages = {}
+        self._created = 0
+        self._locks = {}
+        self._condition = threading.Condition()
+
+    def acquire(self):
+        """Returns an idle driver, starting a new one if the pool is not full, else waits."""
+        with self._condition:
+            while True:
+                if self._idle:
+                    return self._idle.pop()
+                if self._created < self.size:
+                    self._created += 1
+                    break
+                self._condition.wait()
+        if _browser_slots is not None:
+            _browser_slots.acquire()
+        profile_dir, lock = claim_profile_slot(PROFILE_DIR) if PROFILE_DIR else (None, None)
+        try:
+            driver = setup_driver(profile_dir=profile_dir)
+        except Exception:
+            if lock:
+                lock.close()
+            if _browser_slots is not None:
+                _browser_slots.release()
+            with self._condition:
+                self._created -= 1
+                self._condition.notify()
+            raise
+        self._pages[id(driver)] = 0
+        self._locks[id(driver)] = lock
+        return driver
+
+    def release(self, driver, pages=1):
+        """Returns a driver after `pages` page loads; recycles it once it has served max_pages."""
+        pages += self._pages.get(id(driver), 0)
+        if pages >= self.max_pages:
+            print(f"Recycling Chrome after {pages} pages")
+            self.discard(driver)
+            return
+        self._pages[id(driver)] = pages
+        with self._condition:
+            self._idle.append(driver)
+            self._condition.notify()
+
+    def discard(self, driver):
+        """Quits a driver (e.g. after a crash) and frees its slot."""
+        self._pages.pop(id(driver), None)
+        try:
+            driver.quit()
+        except Exception as e:
+            print(f"Error quitting Chrome: {e}")
+        lock = self._locks.pop(id(driver), None)
+        if lock:
+            lock.close()  # frees the profile slot once Chrome has exited
+        if _browser_slots is not None:
+            _browser_slots.release()
+        with self._condition:
+            self._created -= 1
+            self._condition.notify()
+
+    @contextmanager
+    def driver(self, pages=1):
+        """Context manager: a pooled driver that is discarded instead of reused if the block fails."""
+        driver = self.acquire()
+        try:
+            yield driver
+        except Exception:
+            self.discard(driver)
+            raise
+        self.release(driver, pages)
+
+    def shutdown(self):
+        """Quits every idle driver."""
+        with self._condition:
+            idle, self._idle = self._idle, []
+        for driver in idle:
+            self.discard(driver)
+
+
+_pool = None
+_pool_lock = threading.Lock()
+_browser_slots = None
+
+
+def limit_browsers(semaphore):
+    """Shares a (multiprocessing) semaphore that caps how many Chrome instances run at once."""
+    global _browser_slots
+    _browser_slots = semaphore
+
+
+def get_pool():
+    """Returns the process-wide pool shared by all CASE scripts."""
+    global _pool
+    with _pool_lock:
+        if _pool is None:
+            _pool = DriverPool()
+            atexit.register(_pool.shutdown)
+    return _pool
@@ -0,0 +1,348 @@
+import multiprocessing
+import os
+import sqlite3
+import sys
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from urllib.parse import urlparse
+
+import pandas as pd
+
+# Make the shared modules in the repository root importable
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+import case_driver_pool
+import rate_limiter
+from case_spec_table import is_skipped, load_spec_table, load_spec_tables
+
+# One engine for every CASE product line. Usage:
+#   python CASE/case_engine.py                   # all series, in parallel worker processes
+#   python CASE/case_engine.py wheel_loaders ... # selected series
+#   options: --workers N, --sequential
+DB_NAME = "equipment_data.db"
+PRODUCTS_URL = "https://www.casece.com/en-zw/africamiddleeast/products/"
+ENGINE = ("ENGINE",)
+CASE_HOST = urlparse(PRODUCTS_URL).netloc
+
+MAX_WORKERS = os.cpu_count() or 1
+MAX_BROWSERS = int(os.environ.get("CASE_MAX_BROWSERS", "2"))  # Chrome instances across all workers
+
+_in_worker = False
+
+
+def upper_name(name):
+    return name.upper()
+
+
+def normalize_model_name(name):
+    return "CX500C ME" if "CX500C" in name else name.replace("-", " ").upper()
+
+
+C_SERIES_MODELS = ["CX130C", "CX210C", "CX220C", "CX220C-LC-HD", "CX220C-LR", "CX250C", "CX300C", "CX350C", "CX370C", "CX490C", "CX500C"]
+
+# Series definitions. "pages" series read every model column of a few pages into one wide
+# row per spec ({"Category", "Specification", extra columns, one column per model});
+# "models" series emit rows per model ({"Category", "Specification", column}) and load
+# further pages only for models the earlier pages did not list, unless "prefetch" asks for
+# every model page up front (pages that need a browser then render side by side in tabs).
+SERIES = {
+    "bseries_excavators": {
+        "label": "B-series excavator",
+        "table": "case_bseries_excavators_data_specs",
+        "if_exists": "replace",
+        "pages": [(f"{PRODUCTS_URL}excavators/b-series-crawler-excavators/cx700b", {})],
+        "column": "Bseries_{model}",
+    },
+    "compact_track_loaders": {
+        "label": "compact track loaders",
+        "table": "case_compact_track_loaders_data_specs",
+        "if_exists": "replace",
+        "pages": [(f"{PRODUCTS_URL}compact-track-loaders/tr270", {})],
+        "column": "{model}",
+    },
+    "crawler_dozers": {
+        "label": "crawler dozer",
+        "table": "case_crawler_dozer_data_specs",
+        "if_exists": "replace",
+        "pages": [(f"{PRODUCTS_URL}crawler-dozers/1150l", {})],
+        "column": "{model}",
+    },
+    "motor_graders": {
+        "label": "B- series II motor graders",
+        "table": "case_b_seriesii_motor_graders_data_specs",
+        "if_exists": "replace",
+        "pages": [(f"{PRODUCTS_URL}b-series-ii-motor-graders/845b-ii", {})],
+        "column": "{model}",
+    },
+    "compactors": {
+        "label": "compactors",
+        "table": "case_compactors_data_specs",
+        "if_exists": "append",
+        "pages": [
+            (f"{PRODUCTS_URL}compaction/double-drum-rollers/450-dx", {"Roller_Type": "Double Drum Roller"}),
+            (f"{PRODUCTS_URL}compaction/single-drum-rollers/1110ex-d", {"Roller_Type": "Single Drum Roller"}),
+        ],
+        "column": "{model}",
+    },
+    "cseries_excavators": {
+        "label": "C-series excavator",
+        "table": "case_cseries_excavators_data_specs",
+        "if_exists": "append",
+        "base_url": f"{PRODUCTS_URL}excavators/c-series-crawler-excavators/",
+        "models": C_SERIES_MODELS,
+        "normalize": upper_name,
+        "prefetch": True,
+        "column": "Cseries_{model}",
+    },
+    "cseries_excavators_h": {
+        "label": "C-series excavator",
+        "table": "case_cseries_excavators_data_specs_h",
+        "if_exists": "append",
+        "base_url": f"{PRODUCTS_URL}excavators/c-series-crawler-excavators/",
+        "models": C_SERIES_MODELS,
+        "normalize": normalize_model_name,
+        "prefetch": True,
+        "column": "Cseries_{model}",
+    },
+    "wheel_loaders": {
+        "label": "wheel loader",
+        "table": "case_wheel_loader_data_specs",
+        "if_exists": "append",
+        "base_url": f"{PRODUCTS_URL}wheel-loaders/",
+        "models": ["621f", "621xs", "721f", "821f", "921f", "1021f", "1121f"],
+        "normalize": normalize_model_name,
+        "column": "{model}",
+    },
+    "skidsteer_loaders": {
+        "label": "skidsteer loader",
+        "table": "case_skidsteer_loader_data_specs",
+        "if_exists": "append",
+        "base_url": f"{PRODUCTS_URL}b-series-skid-steer-loaders/",
+        "models": ["sr130b", "sr150b", "sr175b", "sv185b", "sr200b", "sr220b", "sr250b", "sv250b", "sv300b"],
+        "normalize": normalize_model_name,
+        "column": "{model}",
+    },
+    "backhoe_loaders": {
+        "label": "backhoe loader",
+        "table": "case_backhoe_loader_data_specs",
+        "if_exists": "append",
+        "base_url": f"{PRODUCTS_URL}v-series-backhoe-loaders/",
+        "models": ["570v", "570sv", "580v", "580sv", "590sv", "689sv"],
+        "normalize": normalize_model_name,
+        "column": "{model}",
+    },
+}
+
+
+def split_engine(rows):
+    """Splits spec rows into (other rows, engine rows); engine rows are filed under Category "ENGINE"."""
+    specs = []
+    engine = []
+    for category, spec_name, values in rows:
+        if is_skipped(category, ENGINE):
+            engine.append(("ENGINE", spec_name, values))
+        else:
+            specs.append((category, spec_name, values))
+    return specs, engine
+
+
+def wide_rows(models, rows, column, extra):
+    """One row per spec with a column for every model on the page."""
+    data = []
+    for category, spec_name, values in rows:
+        entry = {"Category": category, "Specification": spec_name, **extra}
+        for i, model in enumerate(models):
+            entry[column.format(model=model)] = values[i] if i < len(values) else "N/A"
+        data.append(entry)
+    return data
+
+
+def model_rows(models, rows, model, column):
+    """Rows for a single model column, without exact duplicates."""
+    index = models.index(model)
+    data = []
+    seen = set()
+    for category, spec_name, values in rows:
+        entry = {"Category": category, "Specification": spec_name,
+                 column.format(model=model): values[index] if index < len(values) else "N/A"}
+        key = tuple(entry.items())
+        if key not in seen:
+            seen.add(key)
+            data.append(entry)
+    return data
+
+
+def series_urls(series):
+    if "pages" in series:
+        return [url for url, _ in series["pages"]]
+    return [f"{series['base_url']}{path}" for path in series["models"]]
+
+
+def group_series(keys):
+    """Groups series that read the same pages, so each page is loaded once per run."""
+    groups = []
+    for key in keys:
+        urls = set(series_urls(SERIES[key]))
+        for group_keys, group_urls in groups:
+            if urls & group_urls:
+                group_keys.append(key)
+                group_urls.update(urls)
+                break
+        else:
+            groups.append(([key], urls))
+    return [group_keys for group_keys, _ in groups]
+
+
+def load_tables(urls, tables):
+    """Adds the pages of urls missing from tables (the spec tables loaded so far in this group)."""
+    missing = [url for url in urls if url not in tables]
+    if missing:
+        tables.update(load_spec_tables(missing))
+    return tables
+
+
+def scrape_pages(series, tables):
+    load_tables(series_urls(series), tables)
+    data = []
+    for url, extra in series["pages"]:
+        models, rows, _ = tables[url]
+        if not models:
+            print(f"No models found for URL: {url}. Skipping.")
+            continue
+        specs, engine = split_engine(rows)
+        if not engine:
+            print(f"No ENGINE section found on {url}")
+        data.extend(wide_rows(models, specs, series["column"], extra))
+        data.extend(wide_rows(models, engine, series["column"], extra))
+    return data
+
+
+def scrape_models(series, tables):
+    normalize = series["normalize"]
+    names = [normalize(path) for path in series["models"]]
+    urls = series_urls(series)
+    if series.get("prefetch"):
+        load_tables(urls, tables)
+    found = {}
+    for url, name in zip(urls, names):
+        if name in found:
+            continue
+        print(f"Extracting data for {series['label']} series from {url}...")
+        if url not in tables:
+            tables[url] = load_spec_table(url)
+        models, rows, _ = tables[url]
+        models = [normalize(model) for model in models]
+        print(f"Extracted models on page: {models}")
+        specs, engine = split_engine(rows)
+        for model in [name for name in names if name not in found and name in models]:
+            if not engine:
+                print(f"No engine data extracted for model {model}")
+            found[model] = model_rows(models, specs, model, series["column"]) + model_rows(models, engine, model, series["column"])
+
+    data = []
+    for name in names:
+        if name not in found:
+            print(f"Model {name} not found on any page. Skipping...")
+        data.extend(found.get(name, []))
+    return data
+
+
+def scrape_series(keys):
+    """Scrapes a group of series over shared pages; returns [(key, rows)]. Runs in a worker process."""
+    tables = {}
+    results = []
+    try:
+        for key in keys:
+            series = SERIES[key]
+            data = scrape_pages(series, tables) if "pages" in series else scrape_models(series, tables)
+            results.append((key, data))
+    finally:
+        if _in_worker:
+            # Free this worker's browser slot for the other series
+            case_driver_pool.get_pool().shutdown()
+    return results
+
+
+def save_series(key, data):
+    """Writes a series to its table; appended tables gain any new model columns first."""
+    series = SERIES[key]
+    table = series["table"]
+    if not data:
+        print(f"No data to save for {key}.")
+        return
+    df = pd.DataFrame(data)
+    conn = sqlite3.connect(DB_NAME)
+    try:
+        exists = conn.execute("SELECT name FROM sqlite_master WHERE type='table' AND name=?", (table,)).fetchone()
+        if exists and series["if_exists"] == "append":
+            existing_columns = {col[1] for col in conn.execute(f"PRAGMA table_info({table})").fetchall()}
+            for column in df.columns:
+                if column not in existing_columns:
+                    conn.execute(f'ALTER TABLE {table} ADD COLUMN "{column}" TEXT')
+            conn.commit()
+        df.to_sql(table, conn, if_exists=series["if_exists"], index=False)
+    finally:
+        conn.close()
+    print(f"CASE {series['label']} data successfully saved ({len(data)} rows to {table}).")
+
+
+def _init_worker(browser_slots, host_gate):
+    global _in_worker
+    _in_worker = True
+    case_driver_pool.limit_browsers(browser_slots)
+    rate_limiter.share_host(CASE_HOST, host_gate)
+
+
+def run(keys=None, workers=MAX_WORKERS, sequential=False):
+    """Scrapes the given series (all by default) and saves each one as soon as it is done.
+
+    Series that read the same pages are scraped together, so every page is loaded once.
+    Groups run in up to `workers` processes; at most MAX_BROWSERS of them hold a Chrome at
+    a time (most pages are read without one), and all of them share one casece.com request
+    budget. Results are written from this process only.
+    """
+    keys = list(keys or SERIES)
+    unknown = [key for key in keys if key not in SERIES]
+    if unknown:
+        raise ValueError(f"Unknown CASE series: {', '.join(unknown)}. Known: {', '.join(SERIES)}")
+    groups = group_series(keys)
+
+    if sequential or workers <= 1 or len(groups) == 1:
+        for group in groups:
+            for key, data in scrape_series(group):
+                save_series(key, data)
+        return
+
+    browser_slots = multiprocessing.BoundedSemaphore(MAX_BROWSERS)
+    host_gate = rate_limiter.host_gate()
+    with ProcessPoolExecutor(max_workers=min(workers, len(groups)), initializer=_init_worker,
+                             initargs=(browser_slots, host_gate)) as executor:
+        futures = {executor.submit(scrape_series, group): group for group in groups}
+        for future in as_completed(futures):
+            try:
+                results = future.result()
+            except Exception as e:
+                print(f"CASE series {', '.join(futures[future])} failed: {e}")
+                continue
+            for key, data in results:
+                try:
+                    save_series(key, data)
+                except Exception as e:
+                    print(f"Saving CASE series {key} failed: {e}")
+
+
+def main(argv):
+    keys = []
+    workers = MAX_WORKERS
+    sequential = False
+    args = iter(argv)
+    for arg in args:
+        if arg == "--sequential":
+            sequential = True
+        elif arg == "--workers":
+            workers = int(next(args))
+        else:
+            keys.append(arg)
+    run(keys, workers=workers, sequential=sequential)
+
+
+if __name__ == "__main__":
+    main(sys.argv[1:])
@@ -0,0 +1,114 @@
+import os
+import shutil
+import statistics
+import sys
+import tempfile
+import time
+
+from selenium.common.exceptions import TimeoutException
+from selenium.webdriver.common.by import By
+from selenium.webdriver.support import expected_conditions as EC
+from selenium.webdriver.support.ui import WebDriverWait
+
+# Make the shared modules in the repository root importable
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+import rate_limiter
+from case_driver_pool import CACHE_DIR, forget_driver_paths, setup_driver
+from case_spec_table import MODEL_HEADING_CLASS, PAGE_TIMEOUT
+
+# Compares page latency and bytes transferred between the full and the lean Chrome profile,
+# or (with --startup) cold vs warm browser bootstrap.
+# Usage: python CASE/case_profile_benchmark.py [--startup] [url ...]
+DEFAULT_URLS = [
+    "https://www.casece.com/en-zw/africamiddleeast/products/excavators/b-series-crawler-excavators/cx700b",
+    "https://www.casece.com/en-zw/africamiddleeast/products/crawler-dozers/1150l",
+    "https://www.casece.com/en-zw/africamiddleeast/products/wheel-loaders/621f",
+]
+ROUNDS = 2
+
+# Bytes fetched over the network for the current page (document plus subresources)
+TRANSFER_SCRIPT = """
+var entries = performance.getEntriesByType("navigation").concat(performance.getEntriesByType("resource"));
+return entries.reduce(function (total, entry) { return total + (entry.transferSize || 0); }, 0);
+"""
+
+
+def time_profile(lean, urls, rounds=ROUNDS):
+    """Loads every url `rounds` times in one fresh driver; returns (seconds, bytes) per page load."""
+    driver = setup_driver(lean=lean)
+    timings = []
+    transferred = []
+    try:
+        for _ in range(rounds):
+            for url in urls:
+                rate_limiter.acquire(url)
+                start = time.perf_counter()
+                driver.get(url)
+                try:
+                    WebDriverWait(driver, PAGE_TIMEOUT).until(
+                        EC.presence_of_element_located((By.CLASS_NAME, MODEL_HEADING_CLASS)))
+                except TimeoutException:
+                    print(f"Spec table did not render: {url}")
+                    continue
+                timings.append(time.perf_counter() - start)
+                transferred.append(driver.execute_script(TRANSFER_SCRIPT) or 0)
+    finally:
+        driver.quit()
+    return timings, transferred
+
+
+def time_startup(url, profile_dir):
+    """Seconds to start Chrome and seconds to render url in it."""
+    start = time.perf_counter()
+    driver = setup_driver(profile_dir=profile_dir)
+    started = time.perf_counter() - start
+    try:
+        rate_limiter.acquire(url)
+        start = time.perf_counter()
+        driver.get(url)
+        try:
+            WebDriverWait(driver, PAGE_TIMEOUT).until(
+                EC.presence_of_element_located((By.CLASS_NAME, MODEL_HEADING_CLASS)))
+        except TimeoutException:
+            print(f"Spec table did not render: {url}")
+        loaded = time.perf_counter() - start
+    finally:
+        driver.quit()
+    return started, loaded
+
+
+def main_startup(url):
+    """Cold: chromedriver resolved by Selenium Manager and a throwaway profile.
+    Warm: cached chromedriver path and a persistent profile whose HTTP cache was filled by a first run.
+    """
+    temp_profile = tempfile.mkdtemp(prefix="case-cold-")
+    warm_profile = os.path.join(CACHE_DIR, "benchmark-profile")
+    try:
+        forget_driver_paths()
+        cold = time_startup(url, temp_profile)
+        time_startup(url, warm_profile)  # fills the persistent profile
+        warm = time_startup(url, warm_profile)
+    finally:
+        shutil.rmtree(temp_profile, ignore_errors=True)
+    print(f"cold: startup {cold[0]:.2f}s, first page {cold[1]:.2f}s")
+    print(f"warm: startup {warm[0]:.2f}s, first page {warm[1]:.2f}s")
+
+
+def main(urls):
+    print(f"Timing {len(urls)} CASE pages x {ROUNDS} rounds per profile")
+    for label, lean in (("full", False), ("lean", True)):
+        timings, transferred = time_profile(lean, urls)
+        if not timings:
+            print(f"{label:>5}: no page rendered")
+            continue
+        print(f"{label:>5}: median {statistics.median(timings):.2f}s, mean {statistics.mean(timings):.2f}s, "
+              f"{statistics.mean(transferred) / 1024:.0f} KiB per page over {len(timings)} loads")
+
+
+if __name__ == "__main__":
+    args = sys.argv[1:]
+    if "--startup" in args:
+        args.remove("--startup")
+        main_startup((args or DEFAULT_URLS)[0])
+    else:
+        main(args or DEFAULT_URLS)
@@ -0,0 +1,338 @@
+import os
+import sys
+from concurrent.futures import ThreadPoolExecutor
+
+from selenium.common.exceptions import TimeoutException
+from selenium.webdriver.common.by import By
+from selenium.webdriver.support import expected_conditions as EC
+from selenium.webdriver.support.ui import WebDriverWait
+
+# Make the shared modules in the repository root importable
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+import http_client
+from html_parser import make_soup
+import rate_limiter
+import response_archive
+from case_driver_pool import get_pool, open_tab
+
+MODEL_HEADING_CLASS = "model-detail-specification-table__col-heading__title-spec"
+CATEGORY_CLASS = "model-detail-specification-table__spec-category-row__inner-box"
+
+PAGE_TIMEOUT = 20  # seconds to wait for the spec table to render
+EXPAND_TIMEOUT = 10  # seconds to wait for expanded sections to show their rows
+POLL_FREQUENCY = 0.25
+
+# Try the plain server HTML before starting a browser (CASE_STATIC_FIRST=0 always uses Chrome)
+STATIC_FIRST = os.environ.get("CASE_STATIC_FIRST", "1") != "0"
+
+TABS = int(os.environ.get("CASE_TABS", "4"))  # pages rendered side by side in one Chrome
+STATIC_WORKERS = 4  # concurrent static page fetches
+
+# Clicks every category header whose label does not contain one of the skipped words
+EXPAND_SCRIPT = """
+var skip = arguments[0];
+var boxes = document.getElementsByClassName(arguments[1]);
+var clicked = 0;
+for (var i = 0; i < boxes.length; i++) {
+    var label = (boxes[i].textContent || "").trim().toUpperCase();
+    if (skip.some(function (word) { return label.indexOf(word) !== -1; })) {
+        continue;
+    }
+    boxes[i].click();
+    clicked++;
+}
+return clicked;
+"""
+
+# Number of spec rows (rows with cells) that are currently displayed
+VISIBLE_ROWS_SCRIPT = """
+return Array.prototype.filter.call(document.querySelectorAll("tr"), function (row) {
+    return row.querySelector("td") !== null && row.offsetParent !== null;
+}).length;
+"""
+
+# Visible text of the model column headings
+MODELS_SCRIPT = """
+return Array.prototype.map.call(document.getElementsByClassName(arguments[0]), function (heading) {
+    return heading.getClientRects().length ? heading.innerText.trim() : "";
+});
+"""
+
+# The whole spec table as [category, spec name, [value per model column]] rows. Text is read
+# the way WebDriver's element.text reads it: rows that are not displayed come back empty.
+TABLE_SCRIPT = """
+function visibleText(element) {
+    return element.getClientRects().length ? element.innerText.trim() : "";
+}
+var categoryClass = arguments[0];
+var rows = [];
+var category = "";
+Array.prototype.forEach.call(document.getElementsByTagName("tr"), function (row) {
+    var box = row.getElementsByClassName(categoryClass);
+    if (box.length) {
+        category = visibleText(box[0]);
+        return;
+    }
+    var cells = row.getElementsByTagName("td");
+    if (cells.length < 2) {
+        return;
+    }
+    var values = [];
+    for (var i = 1; i < cells.length; i++) {
+        values.push(visibleText(cells[i]));
+    }
+    rows.push([category, visibleText(cells[0]), values]);
+});
+return rows;
+"""
+
+
+def wait_for_spec_table(driver, url, timeout=PAGE_TIMEOUT):
+    """Waits until the model headings of the spec table are present; False on timeout."""
+    try:
+        WebDriverWait(driver, timeout, poll_frequency=POLL_FREQUENCY).until(
+            EC.presence_of_element_located((By.CLASS_NAME, MODEL_HEADING_CLASS)))
+    except TimeoutException:
+        print(f"Spec table did not render within {timeout}s: {url}")
+        return False
+    return True
+
+
+def load_spec_page(driver, url, timeout=PAGE_TIMEOUT):
+    """Opens url and waits until the model headings of the spec table are present.
+
+    Returns False if they do not appear within timeout seconds.
+    """
+    rate_limiter.acquire(url)  # Browser page loads share the per-host budget
+    driver.get(url)
+    return wait_for_spec_table(driver, url, timeout)
+
+
+def start_expanding(driver, skip=()):
+    """Clicks all spec categories (except skip) in one scripted pass; returns (visible rows before, clicked)."""
+    before = driver.execute_script(VISIBLE_ROWS_SCRIPT)
+    clicked = driver.execute_script(EXPAND_SCRIPT, [word.upper() for word in skip], CATEGORY_CLASS)
+    return before, clicked
+
+
+def wait_expanded(driver, before, timeout=EXPAND_TIMEOUT):
+    """Waits until more rows than before are visible and the count has stopped changing."""
+    counts = []
+
+    def rows_settled(driver):
+        counts.append(driver.execute_script(VISIBLE_ROWS_SCRIPT))
+        return len(counts) >= 2 and counts[-1] > before and counts[-1] == counts[-2]
+
+    try:
+        WebDriverWait(driver, timeout, poll_frequency=POLL_FREQUENCY).until(rows_settled)
+    except TimeoutException:
+        print(f"Sections still expanding after {timeout}s; reading the table as it is")
+
+
+def expand_sections(driver, skip=(), timeout=EXPAND_TIMEOUT):
+    """Expands all spec categories in one scripted pass and waits until their rows are shown.
+
+    Categories whose label contains a word from skip are left collapsed. Returns the
+    number of categories clicked.
+    """
+    before, clicked = start_expanding(driver, skip)
+    if clicked:
+        wait_expanded(driver, before, timeout)
+    return clicked
+
+
+def collapse_whitespace(text):
+    """Joins the words of text with single spaces, so both paths store a cell the same way."""
+    return " ".join(text.split())
+
+
+def read_models(driver):
+    """Returns the model column headings of the rendered spec table in one round trip."""
+    return [collapse_whitespace(model) for model in driver.execute_script(MODELS_SCRIPT, MODEL_HEADING_CLASS)]
+
+
+def is_skipped(category, skip):
+    return any(word.upper() in category.upper() for word in skip)
+
+
+def read_spec_rows(driver, skip=()):
+    """Returns every spec row of the rendered table as (category, spec name, values) in one round trip.
+
+    Rows of categories matching skip (left collapsed by expand_sections) are dropped.
+    Whitespace is collapsed as in parse_static_table, so line breaks inside a cell become spaces.
+    """
+    rows = []
+    for category, name, values in driver.execute_script(TABLE_SCRIPT, CATEGORY_CLASS):
+        if not is_skipped(category, skip):
+            rows.append((collapse_whitespace(category), collapse_whitespace(name),
+                         [collapse_whitespace(value) for value in values]))
+    return rows
+
+
+def _text(tag):
+    return collapse_whitespace(tag.get_text(" "))
+
+
+def parse_static_table(html, skip=()):
+    """Reads the spec table from page HTML the way TABLE_SCRIPT reads it from the browser.
+
+    Returns (models, categories, rows); categories lists every category header found,
+    including skipped ones, and rows of skipped categories are dropped.
+    """
+    soup = make_soup(html)
+    models = [_text(heading) for heading in soup.find_all(class_=MODEL_HEADING_CLASS)]
+    categories = []
+    rows = []
+    category = ""
+    for row in soup.find_all("tr"):
+        box = row.find(class_=CATEGORY_CLASS)
+        if box:
+            category = _text(box)
+            categories.append(category)
+            continue
+        cells = row.find_all("td")
+        if len(cells) < 2 or is_skipped(category, skip):
+            continue
+        rows.append((category, _text(cells[0]), [_text(cell) for cell in cells[1:]]))
+    return models, categories, rows
+
+
+def static_table_complete(models, categories, rows, skip=()):
+    """True if the static HTML lists models and every (non-skipped) category has filled-in rows."""
+    if not models or not categories:
+        return False
+    filled = {category for category, _, values in rows if any(values)}
+    return all(category in filled for category in categories if not is_skipped(category, skip))
+
+
+def fetch_static_page(url):
+    """Returns the server HTML of url (or its archived render when replaying), or None."""
+    if response_archive.is_replaying():
+        html = response_archive.replay_page(url)
+        if html is not None:
+            return html
+    try:
+        response = http_client.get(url)
+    except Exception as e:
+        print(f"Static fetch failed for {url}: {e}")
+        return None
+    if response.status_code != 200:
+        print(f"Static fetch failed for {url} (status {response.status_code})")
+        return None
+    return response.text
+
+
+def replay_spec_table(url, skip=()):
+    """load_spec_table from the archive alone: a page missing from it is reported, never loaded live."""
+    html = fetch_static_page(url)
+    if html:
+        models, categories, rows = parse_static_table(html, skip)
+        if static_table_complete(models, categories, rows, skip):
+            return models, rows, html
+    print(f"No complete archived page for {url}; skipping it in replay mode")
+    return [], [], None
+
+
+def load_spec_table(url, skip=()):
+    """Returns (models, rows, page_source) for a CASE spec page.
+
+    The server HTML is tried first; headless Chrome is only started when that page lacks
+    the model headings or has categories without rows. rows are (category, spec name,
+    values) tuples; models is empty when the page has no spec table. When replaying,
+    only the archive is read.
+    """
+    if response_archive.is_replaying():
+        return replay_spec_table(url, skip)
+    if STATIC_FIRST:
+        html = fetch_static_page(url)
+        if html:
+            models, categories, rows = parse_static_table(html, skip)
+            if static_table_complete(models, categories, rows, skip):
+                return models, rows, html
+            print(f"Static HTML of {url} is missing sections; rendering it in Chrome")
+
+    with get_pool().driver() as driver:
+        load_spec_page(driver, url)
+        models = read_models(driver)
+        if not models:
+            return [], [], None
+        expand_sections(driver, skip=skip)
+        page_source = driver.page_source
+        rows = read_spec_rows(driver, skip)
+    response_archive.archive_page(url, page_source)
+    return models, rows, page_source
+
+
+def render_spec_pages(driver, urls, skip=(), tabs=TABS):
+    """Renders several spec pages at once in tabs of one Chrome; yields (url, (models, rows, page_source)).
+
+    Each batch of up to `tabs` pages is started in its own tab without waiting, so the
+    loads and section animations overlap; the tabs are then visited in turn to expand
+    and read them. The first page of a batch reuses the current tab, which is blanked
+    first. Extra tabs are closed again before the next batch.
+    """
+    home = driver.current_window_handle
+    for start in range(0, len(urls), tabs):
+        batch = urls[start:start + tabs]
+        handles = []
+        for url in batch:
+            if handles:
+                open_tab(driver)
+            else:
+                # The reused tab still shows its last spec page, and the scripted navigation
+                # below returns before it leaves; blank it so the wait sees only the new page
+                driver.get("about:blank")
+            rate_limiter.acquire(url)  # Browser page loads share the per-host budget
+            driver.execute_script("window.location.href = arguments[0];", url)
+            handles.append(driver.current_window_handle)
+
+        expanding = {}
+        for handle, url in zip(handles, batch):
+            driver.switch_to.window(handle)
+            if wait_for_spec_table(driver, url) and read_models(driver):
+                expanding[handle] = start_expanding(driver, skip)
+
+        for handle, url in zip(handles, batch):
+            driver.switch_to.window(handle)
+            if handle not in expanding:
+                yield url, ([], [], None)
+                continue
+            before, clicked = expanding[handle]
+            if clicked:
+                wait_expanded(driver, before)
+            page_source = driver.page_source
+            response_archive.archive_page(url, page_source)
+            yield url, (read_models(driver), read_spec_rows(driver, skip), page_source)
+
+        for handle in handles:
+            if handle != home:
+                driver.switch_to.window(handle)
+                driver.close()
+        driver.switch_to.window(home)
+
+
+def load_spec_tables(urls, skip=()):
+    """load_spec_table for many pages: returns {url: (models, rows, page_source)}.
+
+    Static pages are fetched concurrently; the ones that need a browser are rendered
+    together in tabs of a single pooled Chrome. When replaying, only the archive is read.
+    """
+    if response_archive.is_replaying():
+        return {url: replay_spec_table(url, skip) for url in urls}
+    tables = {}
+    if STATIC_FIRST:
+        with ThreadPoolExecutor(max_workers=STATIC_WORKERS) as executor:
+            for url, html in zip(urls, executor.map(fetch_static_page, urls)):
+                if not html:
+                    continue
+                models, categories, rows = parse_static_table(html, skip)
+                if static_table_complete(models, categories, rows, skip):
+                    tables[url] = (models, rows, html)
+                else:
+                    print(f"Static HTML of {url} is missing sections; rendering it in Chrome")
+
+    remaining = [url for url in dict.fromkeys(urls) if url not in tables]
+    if remaining:
+        with get_pool().driver(pages=len(remaining)) as driver:
+            tables.update(render_spec_pages(driver, remaining, skip))
+    return tables
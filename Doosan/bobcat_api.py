@@ -0,0 +1,154 @@
+import os
+import sys
+from concurrent.futures import ThreadPoolExecutor, as_completed
+
+# Make the shared modules in the repository root importable
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+import http_client
+import response_cache
+
+SEARCH_URL = "https://bobcat.api.bobcat.com/search/product"
+SPECS_URL = "https://bobcat.api.bobcat.com/products/bobcat/{model_code}/specs"
+
+# Query string for the EU spec sheets
+SPEC_PARAMS = {
+    "uom": "us",
+    "locale": "en-GB",
+    "businessUnit": "emea",
+    "region": "eu",
+    "specLevel": "3",
+    "modelType": "product",
+    "instance": "public",
+    "noerror": "true",
+    "lang": "en",
+    "productDetailsDataSource": "default"
+}
+
+HEADERS = {
+    "accept": "application/json, text/plain, */*",
+    "origin": "https://www.bobcat.com",
+    "referer": "https://www.bobcat.com/"
+}
+
+DEFAULT_PAGE_SIZE = 100
+MAX_WORKERS = 4  # concurrent requests per search
+MAX_SPEC_WORKERS = 8  # concurrent spec sheet requests
+
+# Keys under which the search API may report the number of hits ("count" is left out: it
+# usually means the size of the current window, not of the whole result set)
+TOTAL_KEYS = ("total", "totalCount", "totalResults", "totalHits")
+
+
+def extract_products(data):
+    """Returns the product list of a search response, or None if the structure is unknown."""
+    if isinstance(data, list):
+        return data
+    if isinstance(data, dict):
+        for key in ("items", "results"):
+            if key in data:
+                return data[key]
+    return None
+
+
+def extract_total(data):
+    """Returns the total hit count of a search response, or None if it is not reported."""
+    if not isinstance(data, dict):
+        return None
+    for key in TOTAL_KEYS:
+        value = data.get(key)
+        if isinstance(value, dict):  # Elasticsearch style {"value": n}
+            value = value.get("value")
+        if isinstance(value, int) or isinstance(value, str) and value.isdigit():
+            return int(value)
+    hits = data.get("hits")
+    if isinstance(hits, dict):
+        return extract_total(hits)
+    return None
+
+
+def fetch_window(params, start, size):
+    """GETs one from/size window of a search and returns the decoded JSON."""
+    window = dict(params, **{"from": str(start), "size": str(size)})
+    response = http_client.get(SEARCH_URL, headers=HEADERS, params=window)
+    response.raise_for_status()
+    return response.json()
+
+
+def search_products(params, conditional=True):
+    """Fetches every product matching a search.
+
+    The first window is requested as in `params` (conditionally via response_cache unless
+    conditional=False); its total hit count decides which further from/size windows are
+    fetched, and those are requested concurrently. Returns response_cache.NOT_MODIFIED when
+    the first window is unchanged since the last run. If the API reports no total, windows
+    are fetched one after another until a short one comes back.
+    """
+    start = int(params.get("from", 0))
+    size = int(params.get("size", DEFAULT_PAGE_SIZE))
+
+    if conditional:
+        response = response_cache.conditional_get(SEARCH_URL, headers=HEADERS, params=params)
+    else:
+        response = http_client.get(SEARCH_URL, headers=HEADERS, params=params)
+    response.raise_for_status()
+    if response.status_code == 304:
+        return response_cache.NOT_MODIFIED
+    data = response.json()
+    products = extract_products(data)
+    if products is None:
+        raise ValueError(f"Unexpected JSON structure. Keys found: {list(data.keys()) if isinstance(data, dict) else type(data).__name__}")
+    products = list(products)
+
+    total = extract_total(data)
+    if total is not None and total <= start + len(products) and len(products) >= size:
+        total = None  # a "total" no larger than a full first window may be a window count: probe
+    if total is not None:
+        starts = range(start + size, total, size)
+        with ThreadPoolExecutor(max_workers=MAX_WORKERS) as executor:
+            for window in executor.map(lambda s: fetch_window(params, s, size), starts):
+                products.extend(extract_products(window) or [])
+    elif len(products) >= size:
+        offset = start + size
+        while True:
+            window = extract_products(fetch_window(params, offset, size)) or []
+            products.extend(window)
+            if len(window) < size:
+                break
+            offset += size
+    return products
+
+
+def fetch_specs(model_code):
+    """Fetches the spec sheet of one model code (conditionally, via response_cache).
+
+    Returns the decoded JSON, response_cache.NOT_MODIFIED, or None on failure.
+    """
+    url = SPECS_URL.format(model_code=model_code)
+    try:
+        response = response_cache.conditional_get(url, headers=HEADERS, params=SPEC_PARAMS)
+    except Exception as e:
+        print(f"Failed to fetch specs for model code {model_code}: {e}")
+        return None
+    if response.status_code == 304:
+        return response_cache.NOT_MODIFIED
+    if response.status_code != 200:
+        print(f"Failed to fetch specs for model code {model_code} (status {response.status_code})")
+        return None
+    try:
+        return response.json()
+    except ValueError as e:
+        print(f"Invalid spec JSON for model code {model_code}: {e}")
+        return None
+
+
+def fetch_specs_batch(model_codes, max_workers=MAX_SPEC_WORKERS):
+    """Fetches many spec sheets concurrently; yields (model_code, result of fetch_specs) as they complete."""
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        futures = {executor.submit(fetch_specs, code): code for code in model_codes}
+        for future in as_completed(futures):
+            yield futures[future], future.result()
+
+
+def mark_specs_stored(model_code):
+    """Records the validators of a spec sheet once it has been written to the database."""
+    response_cache.mark_stored(SPECS_URL.format(model_code=model_code), SPEC_PARAMS)
@@ -1,18 +1,24 @@
-import requests
 import sqlite3
-import time
 import re
 
+import bobcat_api
+import response_cache
+
 # SQLite DB and table setup
 DB_PATH = "equipment_data.db"
 TABLE_NAME = "doosan_compact_excavators_specs"
 
-# API headers
-HEADERS = {
-    "accept": "application/json, text/plain, */*",
-    "origin": "https://www.bobcat.com",
-    "referer": "https://www.bobcat.com/",
-    "user-agent": "Mozilla/5.0"
+# Search used to discover the current mini excavator model codes
+MODEL_SEARCH = {
+    "region": "eu",
+    "category": "Excavators",
+    "subcategory": "Mini Excavators",
+    "hideSelectedVariants": "false",
+    "facetCategory": "/bobcat/eu/products/Mini-Excavators",
+    "lang": "en",
+    "from": "0",
+    "size": "100",
+    "sort": "name.keyword:asc"
 }
 
 # Helper to normalize spec keys
@@ -38,7 +44,7 @@ CREATE TABLE IF NOT EXISTS {TABLE_NAME} (
 """)
 conn.commit()
 
-# Known model codes and their corresponding URLs
+# Known model codes and their corresponding URLs (fallback and category hints for discovery)
 model_data = [
     {"model_code": "B4PC", "url": "https://www.bobcat.com/eu/en/equipment/mini-excavators/0-1t-mini-excavators/e08"},
     {"model_code": "B55N", "url": "https://www.bobcat.com/eu/en/equipment/mini-excavators/1-1t-mini-excavators/e10e"},
@@ -72,31 +78,30 @@ def extract_category(url):
         return match.group(1).replace('-', ' ')
     return "Unknown"
 
-# Fetch and parse specs
-def fetch_specs(model_info):
-    model_code = model_info["model_code"]
-    url = f"https://bobcat.api.bobcat.com/products/bobcat/{model_code}/specs"
-    params = {
-        "uom": "us",
-        "locale": "en-GB",
-        "businessUnit": "emea",
-        "region": "eu",
-        "specLevel": "3",
-        "modelType": "product",
-        "instance": "public",
-        "noerror": "true",
-        "lang": "en",
-        "productDetailsDataSource": "default"
-    }
-    response = requests.get(url, headers=HEADERS, params=params)
-    if response.status_code != 200:
-        print(f"Failed to fetch specs for model code {model_code}")
-        return
-
-    data = response.json()
+# Discover model codes from the search API, keeping the known list as a fallback
+def discover_models():
+    models = {info["model_code"]: dict(info) for info in model_data}
+    try:
+        products = bobcat_api.search_products(MODEL_SEARCH, conditional=False)
+    except Exception as e:
+        print(f"Model discovery failed, using the known model list: {e}")
+        return list(models.values())
+
+    for product in products:
+        model_code = product.get("id") or product.get("code")
+        if not model_code or model_code in models:
+            continue
+        url = next((product[key] for key in ("url", "link", "path", "productUrl") if product.get(key)), "")
+        models[model_code] = {"model_code": model_code, "url": url}
+        print(f"Discovered new model {product.get('name', model_code)} ({model_code})")
+    return list(models.values())
+
+# Parse a spec sheet into a row
+def parse_specs(model_info, data):
     if not isinstance(data, dict) or "sections" not in data:
-        print(f"Unexpected spec structure for model code {model_code}. Keys: {list(data.keys())}")
-        return
+        keys = list(data.keys()) if isinstance(data, dict) else type(data).__name__
+        print(f"Unexpected spec structure for model code {model_info['model_code']}. Keys: {keys}")
+        return None
 
     specs = {
         "model": data.get("name", "Unknown"),
@@ -113,37 +118,52 @@ def fetch_specs(model_info):
             if label and value is not None:
                 col = normalize_key(label, unit)
                 specs[col] = str(value).strip()
+    return specs
 
-    save_to_db(specs)
-
-# Insert or update row
-def save_to_db(specs):
+# Insert all rows in one transaction
+def save_to_db(rows):
+    if not rows:
+        return
     cursor.execute(f"PRAGMA table_info({TABLE_NAME})")
     existing_columns = {col[1] for col in cursor.fetchall()}
 
-    # Add any new columns dynamically (properly quoted)
-    for key in specs.keys():
+    # Add any new columns dynamically (properly quoted), keeping first-seen order
+    all_columns = list(dict.fromkeys(key for specs in rows for key in specs))
+    for key in all_columns:
         if key not in existing_columns:
             cursor.execute(f'ALTER TABLE {TABLE_NAME} ADD COLUMN "{key}" TEXT')
 
     # Insert data (columns also quoted)
-    columns = ', '.join([f'"{col}"' for col in specs.keys()])
-    placeholders = ', '.join(['?'] * len(specs))
-    values = list(specs.values())
-
-    cursor.execute(f"""
+    columns = ', '.join([f'"{col}"' for col in all_columns])
+    placeholders = ', '.join(['?'] * len(all_columns))
+    cursor.executemany(f"""
         INSERT INTO {TABLE_NAME} ({columns})
         VALUES ({placeholders})
-    """, values)
+    """, [[specs.get(col) for col in all_columns] for specs in rows])
     conn.commit()
 
 
 # Main
 if __name__ == "__main__":
     print("Fetching compact excavator models...")
-    for model_info in model_data:
-        fetch_specs(model_info)
-        time.sleep(1)  # avoid rate-limiting
-
-    print("All specs extracted and saved.")
+    models = {info["model_code"]: info for info in discover_models()}
+
+    rows = []
+    stored_codes = []
+    for model_code, data in bobcat_api.fetch_specs_batch(models):
+        if data is response_cache.NOT_MODIFIED:
+            print(f"Specs for model code {model_code} unchanged since last run")
+            continue
+        if data is None:
+            continue
+        specs = parse_specs(models[model_code], data)
+        if specs:
+            rows.append(specs)
+            stored_codes.append(model_code)
+
+    save_to_db(rows)
+    for model_code in stored_codes:
+        bobcat_api.mark_specs_stored(model_code)
+
+    print(f"All specs extracted and saved ({len(rows)} models updated).")
     conn.close()
@@ -1,7 +1,10 @@
-import requests
 import sqlite3
 import re
 import sys
+from concurrent.futures import ThreadPoolExecutor, as_completed
+
+import bobcat_api
+import response_cache
 
 # Configuration
 DB_PATH = "equipment_data.db"  
@@ -67,11 +70,6 @@ LOADERS = {
     },
 }
 
-HEADERS = {
-    "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/135.0.0.0 Safari/537.36",
-    "accept": "application/json, text/plain, */*"
-}
-
 def normalize_column_name(name):
     """Convert key names to lower-case snake_case strings for columns."""
     name = re.sub(r'[^\w\s]', '', name)
@@ -79,35 +77,21 @@ def normalize_column_name(name):
     return name.lower()
 
 def fetch_loader_data(loader_type, endpoint_info):
-    """Fetch JSON data from the API endpoint and extract product records."""
+    """Fetch every product of a loader type from the search API and extract product records.
+
+    All from/size windows are fetched (see bobcat_api.search_products). Returns
+    response_cache.NOT_MODIFIED when the results are unchanged since the last run.
+    """
     try:
-        response = requests.get(endpoint_info["url"], headers=HEADERS, params=endpoint_info["params"])
-        response.raise_for_status()
-    except Exception as e:
-        print(f"[ERROR] Failed to fetch data for {loader_type}: {e}")
+        products = bobcat_api.search_products(endpoint_info["params"])
+    except ValueError as e:
+        print(f"[WARNING] {loader_type}: {e}")
         return []
-    
-    try:
-        data = response.json()
     except Exception as e:
-        print(f"[ERROR] JSON decode error for {loader_type}: {e}")
-        print(f"Response (first 500 chars): {response.text[:500]}")
+        print(f"[ERROR] Failed to fetch data for {loader_type}: {e}")
         return []
-    
-    # Check for known keys:
-    products = []
-    if isinstance(data, dict):
-        if "items" in data:
-            products = data["items"]
-        elif "results" in data:
-            products = data["results"]
-        else:
-            print(f"[WARNING] Unexpected JSON structure for {loader_type}. Keys found: {list(data.keys())}")
-            products = []
-    elif isinstance(data, list):
-        products = data
-    else:
-        print(f"[WARNING] Unexpected JSON type for {loader_type}.")
+    if products is response_cache.NOT_MODIFIED:
+        return response_cache.NOT_MODIFIED
     
     if not products:
         print(f"[WARNING] No records found for {loader_type}.")
@@ -175,6 +159,22 @@ def insert_record(conn, record):
         print(f"[ERROR] Inserting record {record} failed: {e}")
         conn.rollback()
 
+def save_results(conn, results):
+    """Write (loader_type, records) results to the database; returns the number of rows inserted."""
+    total_records = 0
+    for loader_type, records in results:
+        endpoint_info = LOADERS[loader_type]
+        if records is response_cache.NOT_MODIFIED:
+            print(f"{loader_type} unchanged since last run. Skipping...")
+            continue
+        for rec in records:
+            create_or_update_table(conn, rec)
+            insert_record(conn, rec)
+            total_records += 1
+        if records:
+            response_cache.mark_stored(endpoint_info["url"], endpoint_info["params"])
+    return total_records
+
 def main():
     try:
         conn = sqlite3.connect(DB_PATH)
@@ -182,14 +182,14 @@ def main():
         print(f"[ERROR] Unable to connect to database {DB_PATH}: {e}")
         sys.exit(1)
     
-    total_records = 0
-    for loader_type, endpoint_info in LOADERS.items():
-        print(f"Fetching data for: {loader_type}")
-        records = fetch_loader_data(loader_type, endpoint_info)
-        for rec in records:
-            create_or_update_table(conn, rec)
-            insert_record(conn, rec)
-            total_records += 1
+    # Fetch all loader types in parallel; rows are written from this thread as each type completes
+    with ThreadPoolExecutor(max_workers=len(LOADERS)) as executor:
+        futures = {}
+        for loader_type, endpoint_info in LOADERS.items():
+            print(f"Fetching data for: {loader_type}")
+            futures[executor.submit(fetch_loader_data, loader_type, endpoint_info)] = loader_type
+        results = ((futures[future], future.result()) for future in as_completed(futures))
+        total_records = save_results(conn, results)
     conn.close()
     print(f"✅ Data extraction complete! Total records inserted: {total_records}")
 
@@ -1,35 +1,35 @@
+import asyncio
 import requests
 import sqlite3
-import time
+import sys
+from collections import defaultdict
+from urllib.parse import urlparse
 
-# Headers to mimic a real browser
-HEADERS = {
-    "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/110.0.0.0 Safari/537.36"
-}
+import response_cache
 
-# Retry settings
-MAX_RETRIES = 5
-SLEEP_TIME = 5  # seconds
+# Async mode: feeds fetched at once from the same host
+MAX_CONCURRENT_PER_HOST = 8
 
 # Database path
 DB_PATH = "equipment_data.db"
 
 
 def fetch_cat_data(url):
-    """Fetches JSON data from the CAT equipment API with retries."""
-    for attempt in range(MAX_RETRIES):
-        try:
-            response = requests.get(url, headers=HEADERS, timeout=30)
-            if response.status_code == 200:
-                return response.json()
-            else:
-                print(f"Attempt {attempt + 1}: Received status code {response.status_code}")
-        except requests.exceptions.ReadTimeout:
-            print(f"Attempt {attempt + 1}: Request timed out. Retrying...")
-        except requests.exceptions.RequestException as e:
-            print(f"Attempt {attempt + 1}: Request failed - {e}")
-            break
-        time.sleep(SLEEP_TIME)
+    """Fetches JSON data from the CAT equipment API (retries are handled by http_client).
+
+    Returns response_cache.NOT_MODIFIED when the feed is unchanged since the last run.
+    """
+    try:
+        response = response_cache.conditional_get(url, timeout=30)
+        if response.status_code == 304:
+            return response_cache.NOT_MODIFIED
+        if response.status_code == 200:
+            return response.json()
+    except (requests.exceptions.RequestException, ValueError) as e:
+        # ValueError: a 200 response whose body is not JSON (e.g. a maintenance page)
+        print(f"Request failed - {e}")
+        return None
+    print(f"Received status code {response.status_code} from {url}")
     return None  # Failed after all retries
 
 
@@ -85,6 +85,16 @@ def save_to_sqlite(data, table_name):
     print(f"Data successfully saved to table '{table_name}' in SQLite database.")
 
 
+def store_feed(data, table_name, url):
+    """Saves a fetched feed and records its validators; unchanged feeds are skipped."""
+    if data is response_cache.NOT_MODIFIED:
+        print(f"{table_name} unchanged since last run. Skipping...")
+        return
+    save_to_sqlite(data, table_name)
+    if data:
+        response_cache.mark_stored(url)
+
+
 # URLs for different CAT equipment categories
 equipment_urls = {
     "cat_articulated_trucks_specs": "https://www.cat.com/content/catdotcom/en_US/products/new/equipment/articulated-trucks/jcr:content/root/responsivegrid/productcards.feed.json",
@@ -112,8 +122,46 @@ equipment_urls = {
     "cat_electric_rope_shovels_specs": "https://www.cat.com/content/catdotcom/en_US/products/new/equipment/electric-rope-shovels/jcr:content/root/responsivegrid/productcards.feed.json"
 }
 
-# Process each equipment category
-for table, url in equipment_urls.items():
-    print(f"Fetching data for {table}...")
-    data = fetch_cat_data(url)
-    save_to_sqlite(data, table)
+async def fetch_cat_data_async(url, host_limits):
+    """Runs fetch_cat_data in a worker thread, bounded by the per-host limit."""
+    async with host_limits[urlparse(url).netloc]:
+        return await asyncio.to_thread(fetch_cat_data, url)
+
+
+async def fetch_all_async(urls):
+    """Fetches every feed concurrently and saves each one as soon as it arrives."""
+    host_limits = defaultdict(lambda: asyncio.Semaphore(MAX_CONCURRENT_PER_HOST))
+
+    async def fetch(table, url):
+        print(f"Fetching data for {table}...")
+        try:
+            data = await fetch_cat_data_async(url, host_limits)
+        except Exception as e:
+            print(f"Fetching {table} failed - {e}")
+            data = None
+        return table, url, data
+
+    # Errors are handled per feed, so one bad feed never stops the others
+    tasks = [asyncio.create_task(fetch(table, url)) for table, url in urls.items()]
+    for task in asyncio.as_completed(tasks):
+        table, url, data = await task
+        try:
+            store_feed(data, table, url)
+        except Exception as e:
+            print(f"Saving {table} failed - {e}")
+
+
+def fetch_all_sequential(urls):
+    """Fetches and saves the feeds one after another."""
+    for table, url in urls.items():
+        print(f"Fetching data for {table}...")
+        data = fetch_cat_data(url)
+        store_feed(data, table, url)
+
+
+if __name__ == "__main__":
+    # Pass --sequential to fetch the categories one at a time
+    if "--sequential" in sys.argv[1:]:
+        fetch_all_sequential(equipment_urls)
+    else:
+        asyncio.run(fetch_all_async(equipment_urls))
@@ -1,8 +1,9 @@
-import requests
 import sqlite3
 import json
 from bs4 import BeautifulSoup
 
+import response_cache
+
 # SQLite Database
 DB_NAME = "equipment_data.db"
 
@@ -55,9 +56,11 @@ def create_table(cursor, table_name, columns):
         )
     """)
 
-# Fetch JSON Data
+# Fetch JSON Data (response_cache.NOT_MODIFIED if unchanged since the last run)
 def fetch_data(json_api_url):
-    response = requests.get(json_api_url)
+    response = response_cache.conditional_get(json_api_url)
+    if response.status_code == 304:
+        return response_cache.NOT_MODIFIED
     if response.status_code != 200:
         print(f"Failed to fetch data from {json_api_url}")
         return []
@@ -93,6 +96,9 @@ def main():
     for category in CATEGORY_PAGES:
         table_name = category["category"]
         data = fetch_data(category["json_api"])
+        if data is response_cache.NOT_MODIFIED:
+            print(f"No changes for category: {table_name}")
+            continue
         if not data:
             continue
         
@@ -104,6 +110,7 @@ def main():
         create_table(cursor, table_name, feature_columns)
         insert_data(cursor, table_name, data)
         conn.commit()
+        response_cache.mark_stored(category["json_api"])
         print(f"Successfully stored data for category: {table_name}")
     
     conn.close()
@@ -0,0 +1,43 @@
+import os
+
+from bs4 import BeautifulSoup, FeatureNotFound
+
+# BeautifulSoup backend used by every scraper. lxml (C, libxml2) is several times faster
+# than the pure-Python "html.parser" and is picked when installed; set HM_HTML_PARSER to
+# "lxml", "html.parser" or "html5lib" to force one.
+FALLBACK_PARSER = "html.parser"
+PREFERRED_PARSERS = ("lxml", FALLBACK_PARSER)
+KNOWN_PARSERS = ("lxml", "html.parser", "html5lib")
+
+
+def is_available(parser):
+    """True if BeautifulSoup can build a tree with this backend."""
+    try:
+        BeautifulSoup("", parser)
+    except FeatureNotFound:
+        return False
+    return True
+
+
+def available_parsers():
+    return [parser for parser in KNOWN_PARSERS if is_available(parser)]
+
+
+def default_parser():
+    requested = os.environ.get("HM_HTML_PARSER")
+    if requested:
+        if is_available(requested):
+            return requested
+        print(f"HTML parser {requested!r} is not installed; falling back")
+    for parser in PREFERRED_PARSERS:
+        if is_available(parser):
+            return parser
+    return FALLBACK_PARSER
+
+
+PARSER = default_parser()
+
+
+def make_soup(markup, parser=None, **kwargs):
+    """BeautifulSoup(markup) with the configured backend (or an explicit one)."""
+    return BeautifulSoup(markup, parser or PARSER, **kwargs)
@@ -0,0 +1,93 @@
+import threading
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.request import ACCEPT_ENCODING
+
+import rate_limiter
+import response_archive
+import retry_policy
+
+# Default headers sent by every scraper; per-site headers (Referer, Origin, ...) are passed per request
+DEFAULT_HEADERS = {
+    "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/134.0.0.0 Safari/537.36",
+    "Accept": "*/*",
+    # Only advertise encodings urllib3 can decode (br needs the brotli package)
+    "Accept-Encoding": ACCEPT_ENCODING,
+}
+
+# Connection pool settings
+POOL_CONNECTIONS = 16  # number of hosts kept alive at once
+POOL_MAXSIZE = 16  # keep-alive connections per host
+DEFAULT_TIMEOUT = 30  # seconds
+
+_session = None
+_session_lock = threading.Lock()
+
+
+def get_session():
+    """Returns the process-wide requests session, creating it on first use."""
+    global _session
+    if _session is None:
+        with _session_lock:
+            if _session is None:
+                session = requests.Session()
+                adapter = HTTPAdapter(pool_connections=POOL_CONNECTIONS, pool_maxsize=POOL_MAXSIZE)
+                session.mount("http://", adapter)
+                session.mount("https://", adapter)
+                session.headers.update(DEFAULT_HEADERS)
+                _session = session
+    return _session
+
+
+def _retry_after(response):
+    return rate_limiter.parse_retry_after(response.headers.get("Retry-After"))
+
+
+def request(method, url, **kwargs):
+    """Sends a request over the shared keep-alive session.
+
+    With HM_ARCHIVE_MODE=record every response is archived; with
+    HM_ARCHIVE_MODE=replay it is served from the archive without touching the network.
+    Live requests are paced by the adaptive per-host rate limiter and retried
+    with backoff behind a per-host circuit breaker (see retry_policy).
+    """
+    kwargs.setdefault("timeout", DEFAULT_TIMEOUT)
+    if response_archive.is_replaying():
+        return response_archive.replay_response(method, url, params=kwargs.get("params"), data=kwargs.get("data"))
+
+    def send():
+        rate_limiter.acquire(url)
+        try:
+            response = get_session().request(method, url, **kwargs)
+        except requests.exceptions.RequestException:
+            rate_limiter.penalize(url)
+            raise
+        rate_limiter.record(url, response)
+        return response
+
+    response = retry_policy.call_with_retry(url, send, retry_after=_retry_after)
+    response_archive.archive_response(
+        response, method, url,
+        params=kwargs.get("params"), data=kwargs.get("data"), headers=kwargs.get("headers"),
+    )
+    return response
+
+
+def get(url, **kwargs):
+    """GET over the shared session."""
+    return request("GET", url, **kwargs)
+
+
+def post(url, **kwargs):
+    """POST over the shared session."""
+    return request("POST", url, **kwargs)
+
+
+def close():
+    """Closes the shared session and its pooled connections."""
+    global _session
+    with _session_lock:
+        if _session is not None:
+            _session.close()
+            _session = None
@@ -1,7 +1,9 @@
-import requests
 import sqlite3
 
+import response_cache
+
 DB_NAME = "equipment_data.db"
+API_URL = "https://www.komatsu.com/api/producttiles?product={product_id}&language=en"
 
 categories = [
     {
@@ -32,16 +34,16 @@ categories = [
 ]
 
 HEADERS = {
-    "User-Agent": "Mozilla/5.0",
     "Accept": "application/json, text/plain, */*",
-    "Referer": "https://www.komatsu.com/en/products/",
-    "Accept-Encoding": "gzip, deflate, br"
+    "Referer": "https://www.komatsu.com/en/products/"
 }
 
 def fetch_komatsu_data(product_id):
-    url = f"https://www.komatsu.com/api/producttiles?product={product_id}&language=en"
-    response = requests.get(url, headers=HEADERS)
+    url = API_URL.format(product_id=product_id)
+    response = response_cache.conditional_get(url, headers=HEADERS)
     response.raise_for_status()
+    if response.status_code == 304:
+        return response_cache.NOT_MODIFIED
     return response.json()
 
 def standardize_column_name(name):
@@ -99,10 +101,14 @@ def run_multi_category_komatsu_scraper():
         print(f"🔄 Fetching {cat['equipment_name']}...")
         try:
             data = fetch_komatsu_data(cat["product_id"])
+            if data is response_cache.NOT_MODIFIED:
+                print(f"⏭️ {cat['equipment_name']} unchanged since last run\n")
+                continue
             print(f"✅ Fetched data for {cat['equipment_name']}")
 
             records, columns = process_komatsu_data(data, cat["equipment_name"])
             save_to_sqlite(DB_NAME, cat["table_name"], records, columns)
+            response_cache.mark_stored(API_URL.format(product_id=cat["product_id"]))
             print(f"💾 Saved {len(records)} records to {cat['table_name']} ✅\n")
         except Exception as e:
             print(f"❌ Error fetching {cat['equipment_name']}: {e}")
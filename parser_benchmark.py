@@ -0,0 +1,117 @@
+import os
+import sys
+import time
+from urllib.parse import urlparse
+
+import html_parser
+import response_archive
+
+# Re-parses every archived page with each installed BeautifulSoup backend and reports
+# pages/s and records/s, so the parser choice is backed by numbers from real pages.
+# Record pages first (HM_ARCHIVE_MODE=record python volvo.py ...), then:
+#   python parser_benchmark.py [rounds]
+ROOT = os.path.dirname(os.path.abspath(__file__))
+for subdir in ("CASE", "xcmg", "zoomlion"):
+    sys.path.append(os.path.join(ROOT, subdir))
+
+ROUNDS = 3
+
+
+def volvo_records(html, url):
+    import volvo
+    return [volvo.parse_equipment_page(html, url)]
+
+
+def hyundai_records(html, url):
+    import hyundai
+    return [hyundai.parse_equipment_page(html, url)]
+
+
+def xcmg_records(html, url):
+    from xcmg_paginator import PRODUCT_SELECTOR
+    return html_parser.make_soup(html).select(PRODUCT_SELECTOR)
+
+
+def case_records(html, url):
+    from case_spec_table import parse_static_table
+    _, _, rows = parse_static_table(html)
+    return rows
+
+
+def zoomlion_parser(metadata):
+    import zoomlion_engine
+    scat = str((metadata.get("data") or {}).get("sCat"))
+    for key, category in zoomlion_engine.CATEGORIES.items():
+        if category["sCat"] == scat:
+            return lambda html, url: zoomlion_engine.parse_page(key, html)
+    return None
+
+
+def pick_extractor(metadata):
+    """The scraper's own parse function for an archived page, or None if no scraper reads it."""
+    url = metadata["url"]
+    host = urlparse(url).netloc
+    if metadata.get("status") != 200:
+        return None
+    if "volvoce.com" in host:
+        return volvo_records
+    if "hd-hyundaice.com" in host and "/equipment/" in url:
+        return hyundai_records
+    if "xcmg.com" in host and "ajax_prolist" in url:
+        return xcmg_records
+    if "zoomlion.com" in host:
+        return zoomlion_parser(metadata)
+    if "casece.com" in host:
+        return case_records
+    return None
+
+
+def load_pages():
+    pages = []
+    for metadata, content in response_archive.iter_entries():
+        extractor = pick_extractor(metadata)
+        if extractor:
+            html = content.decode(metadata.get("encoding") or "utf-8", errors="replace")
+            pages.append((extractor, html, metadata["url"]))
+    return pages
+
+
+def time_backend(parser, pages, rounds):
+    """Seconds per round and records per round for one backend."""
+    html_parser.PARSER = parser
+    records = 0
+    start = time.perf_counter()
+    for _ in range(rounds):
+        records = 0
+        for extractor, html, url in pages:
+            records += len(extractor(html, url))
+    return (time.perf_counter() - start) / rounds, records
+
+
+def main(rounds=ROUNDS):
+    pages = load_pages()
+    if not pages:
+        print(f"No scraper pages in {response_archive.ARCHIVE_DIR}; record some with HM_ARCHIVE_MODE=record")
+        return
+    parsers = html_parser.available_parsers()
+    print(f"{len(pages)} archived pages, {rounds} rounds per backend ({', '.join(parsers)})")
+    default = html_parser.PARSER
+    results = {}
+    try:
+        time_backend(default, pages, 1)  # warm-up: imports the scrapers outside the timings
+        for parser in parsers:
+            results[parser] = time_backend(parser, pages, rounds)
+    finally:
+        html_parser.PARSER = default
+
+    baseline = results.get(html_parser.FALLBACK_PARSER)
+    for parser, (seconds, records) in results.items():
+        speedup = f", {baseline[0] / seconds:.1f}x {html_parser.FALLBACK_PARSER}" if baseline and seconds else ""
+        print(f"{parser:>12}: {len(pages) / seconds:8.1f} pages/s, {records / seconds:9.1f} records/s "
+              f"({records} records){speedup}")
+        if baseline and records != baseline[1]:
+            print(f"{'':>12}  record count differs from {html_parser.FALLBACK_PARSER} ({baseline[1]})")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else ROUNDS)
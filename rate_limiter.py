@@ -0,0 +1,144 @@
+import multiprocessing
+import threading
+import time
+from email.utils import parsedate_to_datetime
+from urllib.parse import urlparse
+
+# Token bucket settings, per host
+INITIAL_RATE = 2.0  # requests per second
+MIN_RATE = 0.2
+MAX_RATE = 10.0
+BURST = 4  # requests that may go out back to back
+
+# Adaptation: grow additively while the host answers quickly, halve on throttling
+FAST_RESPONSE = 1.0  # seconds
+RATE_STEP = 0.5
+BACKOFF_FACTOR = 0.5
+THROTTLE_STATUSES = {429, 503}
+MAX_RETRY_AFTER = 300  # seconds; ignore absurd Retry-After values beyond this
+
+
+def parse_retry_after(value):
+    """Parses a Retry-After header (seconds or HTTP date) into seconds to wait."""
+    if not value:
+        return None
+    value = value.strip()
+    if value.isdigit():
+        seconds = float(value)
+    else:
+        try:
+            seconds = parsedate_to_datetime(value).timestamp() - time.time()
+        except (TypeError, ValueError):
+            return None
+    return min(max(seconds, 0.0), MAX_RETRY_AFTER)
+
+
+class HostBucket:
+    """Adaptive token bucket for a single host."""
+
+    def __init__(self):
+        self.rate = INITIAL_RATE
+        self.tokens = float(BURST)
+        self.updated = time.monotonic()
+        self.blocked_until = 0.0
+        self.lock = threading.Lock()
+
+    def _refill(self, now):
+        self.tokens = min(BURST, self.tokens + (now - self.updated) * self.rate)
+        self.updated = now
+
+    def acquire(self):
+        """Blocks until a request to this host is allowed."""
+        while True:
+            with self.lock:
+                now = time.monotonic()
+                self._refill(now)
+                wait = self.blocked_until - now
+                if wait <= 0:
+                    if self.tokens >= 1:
+                        self.tokens -= 1
+                        return
+                    wait = (1 - self.tokens) / self.rate
+            time.sleep(wait)
+
+    def record(self, status_code, elapsed, retry_after=None):
+        """Adapts the rate to how the host answered the last request."""
+        with self.lock:
+            if status_code in THROTTLE_STATUSES:
+                self._back_off(retry_after)
+            elif status_code < 400 and elapsed < FAST_RESPONSE:
+                self.rate = min(MAX_RATE, self.rate + RATE_STEP)
+
+    def penalize(self, delay=None):
+        """Backs off after a timeout, connection error or failed attempt."""
+        with self.lock:
+            self._back_off(delay)
+
+    def _back_off(self, delay):
+        now = time.monotonic()
+        self.rate = max(MIN_RATE, self.rate * BACKOFF_FACTOR)
+        self.tokens = 0.0
+        self.updated = now
+        pause = delay if delay is not None else 1 / self.rate
+        self.blocked_until = max(self.blocked_until, now + pause)
+
+
+_buckets = {}
+_buckets_lock = threading.Lock()
+
+# Hosts whose budget is shared with other processes: host -> (lock, next free slot)
+_shared_gates = {}
+
+
+def host_gate(context=multiprocessing):
+    """Creates a gate that spaces requests to one host across processes (see share_host)."""
+    return context.Lock(), context.Value("d", 0.0, lock=False)
+
+
+def get_bucket(url):
+    """Returns the bucket for the host of url."""
+    host = urlparse(url).netloc
+    with _buckets_lock:
+        bucket = _buckets.get(host)
+        if bucket is None:
+            bucket = _buckets[host] = HostBucket()
+    return bucket
+
+
+def share_host(host, gate):
+    """Makes this process pace requests to host through gate (from host_gate()).
+
+    Every process holding the same gate then spaces its requests to host by the bucket's
+    current interval, so together they stay within one host budget instead of one each.
+    """
+    _shared_gates[host] = gate
+
+
+def _wait_for_gate(gate, rate):
+    lock, next_slot = gate
+    with lock:
+        now = time.time()
+        slot = max(now, next_slot.value)
+        next_slot.value = slot + 1 / rate
+    if slot > now:
+        time.sleep(slot - now)
+
+
+def acquire(url):
+    """Waits for a token for the host of url (and for its shared gate, if any)."""
+    bucket = get_bucket(url)
+    bucket.acquire()
+    gate = _shared_gates.get(urlparse(url).netloc)
+    if gate is not None:
+        _wait_for_gate(gate, bucket.rate)
+
+
+def record(url, response):
+    """Feeds the status, latency and Retry-After of a response back into its host bucket."""
+    retry_after = parse_retry_after(response.headers.get("Retry-After"))
+    get_bucket(url).record(response.status_code, response.elapsed.total_seconds(), retry_after)
+
+
+def penalize(url, delay=None):
+    """Slows the host of url down after a failure."""
+    get_bucket(url).penalize(delay)
@@ -0,0 +1,159 @@
+import hashlib
+import json
+import os
+import threading
+import time
+
+import requests
+from requests.structures import CaseInsensitiveDict
+
+# Archive layout:
+#   <ARCHIVE_DIR>/objects/<sha[:2]>/<sha>   raw response bytes, keyed by SHA-256 of the content
+#   <ARCHIVE_DIR>/requests/<key>.json        latest metadata for one request (URL, form payload, headers, sha)
+ARCHIVE_DIR = os.environ.get("HM_ARCHIVE_DIR", ".archive")
+
+# "record" saves every response, "replay" serves responses from the archive instead of the network
+MODE = os.environ.get("HM_ARCHIVE_MODE", "").lower()
+
+# Method name used for page sources captured from Selenium
+BROWSER_METHOD = "BROWSER"
+
+# Transport headers that no longer describe the stored (decoded) bytes
+_DROP_HEADERS = {"content-encoding", "content-length", "transfer-encoding", "connection"}
+
+_write_lock = threading.Lock()
+
+
+class ReplayMiss(requests.exceptions.RequestException):
+    """Raised in replay mode when a request has no archived response."""
+
+
+def is_recording():
+    return MODE == "record"
+
+
+def is_replaying():
+    return MODE == "replay"
+
+
+def request_key(method, url, params=None, data=None):
+    """Hashes method, final URL and form body into a stable key for one request."""
+    prepared = requests.Request(method.upper(), url, params=params, data=data).prepare()
+    body = prepared.body or b""
+    if isinstance(body, str):
+        body = body.encode("utf-8")
+    digest = hashlib.sha256(f"{prepared.method} {prepared.url}\n".encode("utf-8") + body)
+    return digest.hexdigest(), prepared.url
+
+
+def _object_path(sha):
+    return os.path.join(ARCHIVE_DIR, "objects", sha[:2], sha)
+
+
+def _request_path(key):
+    return os.path.join(ARCHIVE_DIR, "requests", f"{key}.json")
+
+
+def _write_entry(key, content, metadata):
+    sha = hashlib.sha256(content).hexdigest()
+    metadata["sha256"] = sha
+    metadata["size"] = len(content)
+    metadata["archived_at"] = time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime())
+
+    object_path = _object_path(sha)
+    request_path = _request_path(key)
+    with _write_lock:
+        if not os.path.exists(object_path):
+            os.makedirs(os.path.dirname(object_path), exist_ok=True)
+            with open(object_path, "wb") as f:
+                f.write(content)
+        os.makedirs(os.path.dirname(request_path), exist_ok=True)
+        with open(request_path, "w", encoding="utf-8") as f:
+            json.dump(metadata, f, indent=1)
+    return sha
+
+
+def _read_entry(key):
+    try:
+        with open(_request_path(key), encoding="utf-8") as f:
+            metadata = json.load(f)
+        with open(_object_path(metadata["sha256"]), "rb") as f:
+            return metadata, f.read()
+    except (OSError, ValueError, KeyError):
+        return None, None
+
+
+def archive_response(response, method, url, params=None, data=None, headers=None):
+    """Stores the raw bytes and request metadata of an HTTP response (record mode only)."""
+    if not is_recording() or response.status_code == 304:
+        return None
+    key, final_url = request_key(method, url, params=params, data=data)
+    metadata = {
+        "method": method.upper(),
+        "url": final_url,
+        "params": params,
+        "data": data,
+        "request_headers": dict(headers or {}),
+        "status": response.status_code,
+        "response_headers": {k: v for k, v in response.headers.items() if k.lower() not in _DROP_HEADERS},
+        "encoding": response.encoding,
+    }
+    return _write_entry(key, response.content, metadata)
+
+
+def archive_page(url, html):
+    """Stores a Selenium page source for url (record mode only)."""
+    if not is_recording():
+        return None
+    key, final_url = request_key(BROWSER_METHOD, url)
+    metadata = {"method": BROWSER_METHOD, "url": final_url, "status": 200, "encoding": "utf-8"}
+    return _write_entry(key, html.encode("utf-8"), metadata)
+
+
+def replay_response(method, url, params=None, data=None):
+    """Rebuilds a requests.Response from the archive; raises ReplayMiss if there is none."""
+    key, final_url = request_key(method, url, params=params, data=data)
+    metadata, content = _read_entry(key)
+    if metadata is None:
+        raise ReplayMiss(f"No archived response for {method.upper()} {final_url}")
+
+    response = requests.Response()
+    response.status_code = metadata["status"]
+    response._content = content
+    response.headers = CaseInsensitiveDict(metadata.get("response_headers", {}))
+    response.encoding = metadata.get("encoding")
+    response.url = final_url
+    response.request = requests.Request(method.upper(), url, params=params, data=data).prepare()
+    return response
+
+
+def replay_page(url):
+    """Returns the archived Selenium page source for url, or None."""
+    key, _ = request_key(BROWSER_METHOD, url)
+    metadata, content = _read_entry(key)
+    if metadata is None:
+        return None
+    return content.decode("utf-8")
+
+
+def iter_entries():
+    """Yields (metadata, content) for every archived request."""
+    requests_dir = os.path.join(ARCHIVE_DIR, "requests")
+    if not os.path.isdir(requests_dir):
+        return
+    for name in sorted(os.listdir(requests_dir)):
+        if name.endswith(".json"):
+            metadata, content = _read_entry(name[:-5])
+            if metadata is not None:
+                yield metadata, content
+
+
+if __name__ == "__main__":
+    # Print a summary of what the archive holds
+    count = 0
+    total = 0
+    for metadata, content in iter_entries():
+        count += 1
+        total += len(content)
+        print(f"{metadata['method']:8} {metadata['status']} {len(content):>9}  {metadata['url']}")
+    print(f"{count} archived responses, {total / 1024:.1f} KiB in {ARCHIVE_DIR}")
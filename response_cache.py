@@ -0,0 +1,92 @@
+import json
+import os
+import threading
+
+import requests
+
+import http_client
+import response_archive
+
+# On-disk store of ETag / Last-Modified validators, keyed by full request URL
+CACHE_PATH = os.path.join(".http_cache", "validators.json")
+
+# Set HM_FORCE_REFRESH=1 to ignore the stored validators and download everything
+FORCE_REFRESH = os.environ.get("HM_FORCE_REFRESH") == "1"
+
+# Returned by fetchers when the server answered 304 Not Modified
+NOT_MODIFIED = object()
+
+_validators = None
+_pending = {}
+_lock = threading.Lock()
+
+
+def cache_key(url, params=None):
+    """Builds the cache key (the final request URL including the query string)."""
+    return requests.Request("GET", url, params=params).prepare().url
+
+
+def _load():
+    global _validators
+    if _validators is None:
+        try:
+            with open(CACHE_PATH, encoding="utf-8") as f:
+                _validators = json.load(f)
+        except (OSError, ValueError):
+            _validators = {}
+    return _validators
+
+
+def _save():
+    os.makedirs(os.path.dirname(CACHE_PATH), exist_ok=True)
+    tmp_path = f"{CACHE_PATH}.tmp"
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        json.dump(_validators, f, indent=1, sort_keys=True)
+    os.replace(tmp_path, CACHE_PATH)
+
+
+def conditional_get(url, params=None, headers=None, **kwargs):
+    """GETs url with If-None-Match / If-Modified-Since set from the cache.
+
+    A 304 response means the data stored on the previous run is still current. In record
+    mode the validators are not sent, so every response is a full 200 that gets archived.
+    Validators of a 200 response are held back until mark_stored() is called,
+    so a failed database write never hides the next change.
+    """
+    if response_archive.is_replaying():
+        # Replays rebuild from the archived bodies and must not touch the live validators
+        return http_client.get(url, params=params, headers=headers, **kwargs)
+
+    key = cache_key(url, params)
+    headers = dict(headers or {})
+    with _lock:
+        # Record runs must download full bodies for the archive, so they send no validators
+        stored = None if FORCE_REFRESH or response_archive.is_recording() else _load().get(key)
+    if stored:
+        if stored.get("etag"):
+            headers["If-None-Match"] = stored["etag"]
+        if stored.get("last_modified"):
+            headers["If-Modified-Since"] = stored["last_modified"]
+
+    response = http_client.get(url, params=params, headers=headers, **kwargs)
+
+    if response.status_code == 200:
+        validators = {
+            "etag": response.headers.get("ETag"),
+            "last_modified": response.headers.get("Last-Modified"),
+        }
+        if validators["etag"] or validators["last_modified"]:
+            with _lock:
+                _pending[key] = validators
+    return response
+
+
+def mark_stored(url, params=None):
+    """Persists the validators of url once its data has been written to the database."""
+    key = cache_key(url, params)
+    with _lock:
+        validators = _pending.pop(key, None)
+        if validators is None:
+            return
+        _load()[key] = validators
+        _save()
@@ -0,0 +1,127 @@
+import random
+import threading
+import time
+from urllib.parse import urlparse
+
+import requests
+
+# Exponential backoff with full jitter: sleep uniform(0, min(MAX_DELAY, BASE_DELAY * 2 ** attempt))
+MAX_ATTEMPTS = 4
+BASE_DELAY = 1.0  # seconds
+MAX_DELAY = 30.0  # seconds
+
+# Retries allowed across the whole run, so a bad night cannot turn into hours of retrying
+RETRY_BUDGET = 200
+
+# Statuses worth retrying; everything else is returned to the caller as-is
+RETRY_STATUSES = {429, 500, 502, 503, 504}
+
+# Circuit breaker: after this many consecutive failures a host is skipped for COOLDOWN seconds
+FAILURE_THRESHOLD = 5
+COOLDOWN = 120.0
+
+
+class CircuitOpenError(requests.exceptions.ConnectionError):
+    """Raised instead of sending a request to a host that is considered down."""
+
+
+class RetryBudgetExceeded(requests.exceptions.RetryError):
+    """Raised when the run has used up its retry budget."""
+
+
+class CircuitBreaker:
+    """Tracks consecutive failures of one host."""
+
+    def __init__(self):
+        self.failures = 0
+        self.opened_at = None
+        self.lock = threading.Lock()
+
+    def allow(self):
+        """True if a request may go out (closed, or half-open after the cooldown)."""
+        with self.lock:
+            if self.opened_at is None:
+                return True
+            return time.monotonic() - self.opened_at >= COOLDOWN
+
+    def success(self):
+        with self.lock:
+            self.failures = 0
+            self.opened_at = None
+
+    def failure(self):
+        with self.lock:
+            self.failures += 1
+            if self.failures >= FAILURE_THRESHOLD:
+                # Opening again after a failed half-open probe restarts the cooldown
+                self.opened_at = time.monotonic()
+
+
+_breakers = {}
+_state_lock = threading.Lock()
+_retries_left = RETRY_BUDGET
+
+
+def get_breaker(url):
+    host = urlparse(url).netloc
+    with _state_lock:
+        breaker = _breakers.get(host)
+        if breaker is None:
+            breaker = _breakers[host] = CircuitBreaker()
+    return breaker
+
+
+def _take_retry():
+    global _retries_left
+    with _state_lock:
+        if _retries_left <= 0:
+            return False
+        _retries_left -= 1
+        return True
+
+
+def backoff_delay(attempt, retry_after=None):
+    """Seconds to wait before retry number attempt (0-based); Retry-After wins if longer."""
+    delay = random.uniform(0, min(MAX_DELAY, BASE_DELAY * 2 ** attempt))
+    if retry_after is not None:
+        delay = max(delay, retry_after)
+    return delay
+
+
+def call_with_retry(url, send, retry_after=None):
+    """Calls send() until it returns a non-retryable response, with backoff and a per-host breaker.
+
+    send is a zero-argument callable performing one request for url. retry_after is an
+    optional callable extracting a Retry-After delay (seconds) from a response. After the
+    last attempt the final response is returned or the final exception re-raised.
+    """
+    breaker = get_breaker(url)
+    attempt = 0
+    while True:
+        if not breaker.allow():
+            raise CircuitOpenError(f"Circuit open for {urlparse(url).netloc}; skipping {url}")
+
+        error = None
+        response = None
+        try:
+            response = send()
+        except (requests.exceptions.ConnectionError, requests.exceptions.Timeout) as e:
+            error = e
+
+        if error is None and response.status_code not in RETRY_STATUSES:
+            breaker.success()
+            return response
+
+        breaker.failure()
+        attempt += 1
+        if attempt >= MAX_ATTEMPTS:
+            if error is not None:
+                raise error
+            return response
+        if not _take_retry():
+            raise RetryBudgetExceeded(f"Retry budget of {RETRY_BUDGET} used up; giving up on {url}")
+
+        wait = backoff_delay(attempt - 1, retry_after(response) if retry_after and response is not None else None)
+        reason = error if error is not None else f"status {response.status_code}"
+        print(f"Retrying {url} in {wait:.1f}s ({reason})")
+        time.sleep(wait)
@@ -1,10 +1,13 @@
-import requests
-from bs4 import BeautifulSoup
 import re
 import sqlite3
 from urllib.parse import urljoin
 from collections import defaultdict
 
+from bs4 import SoupStrainer, Tag
+
+import http_client
+from html_parser import make_soup
+
 BASE_URLS = {
     "excavators": "https://www.volvoce.com/africa/en-za/products/excavators/",
     "wheel_loaders": "https://www.volvoce.com/africa/en-za/products/wheel-loaders/",
@@ -37,42 +40,72 @@ MODEL_SUFFIXES = {
 DB_NAME = "equipment_data.db"
 TABLE_NAME = "volvo_equipment_specs"
 
-def extract_specifications(soup):
-    specs = {}
-    rows = soup.select("table tbody tr")
-    for row in rows:
-        header = row.find("th")
-        value_td = row.find("td")
-        if header and value_td:
-            key = header.get_text(strip=True)
-            val = " ".join(span.get_text(strip=True) for span in value_td.find_all(['span', 'td']) if span.get_text(strip=True))
-            if not val:
-                val = value_td.get_text(strip=True)
-            specs[key] = val
-    return specs
-
-def extract_equipment_name_and_model(soup):
+# Only the elements the page walker reads (title/model typography, headings, spec tables and
+# links) are built into the tree; the rest of the marketing page is skipped while parsing
+PAGE_PARTS = SoupStrainer(["vcdk-typography", "h1", "h2", "table", "a"])
+
+# Tags that can carry the equipment name or model
+NAME_TAGS = {"vcdk-typography", "h1", "h2", "span", "div"}
+
+def first_tag(tag, name):
+    return next((child for child in tag.descendants if child.name == name), None)
+
+def spec_value(value_td):
+    texts = (child.get_text(strip=True) for child in value_td.descendants if child.name in ("span", "td"))
+    return " ".join(text for text in texts if text) or value_td.get_text(strip=True)
+
+def is_spec_row(row):
+    """True for rows matched by "table tbody tr"."""
+    in_body = False
+    for parent in row.parents:
+        if parent.name == "tbody":
+            in_body = True
+        elif parent.name == "table" and in_body:
+            return True
+    return False
+
+def walk_equipment_page(soup, base_url):
+    """Collects name, model, spec rows and the brochure link in one pass over the tree."""
     name = None
     model = None
-    candidates = soup.find_all(["vcdk-typography", "h1", "h2", "span", "div"])
-    for tag in candidates:
-        if not name and tag.get("variant") == "caption1":
-            name = tag.get_text(strip=True)
-        elif not model and tag.get("variant") == "heading2":
-            model = tag.get_text(strip=True)
-        if not model and tag.name in ["h1", "h2"] and "model" in tag.text.lower():
-            model = tag.get_text(strip=True)
-        if name and model:
-            break
-    return name, model
-
-def extract_brochure_link(soup, base_url):
-    pdf_links = soup.find_all("a", href=True)
-    for link in pdf_links:
-        href = link["href"]
-        if href.endswith(".pdf"):
-            return urljoin(base_url, href)
-    return None
+    specs = {}
+    brochure_link = None
+    for tag in soup.descendants:
+        if not isinstance(tag, Tag):
+            continue
+        if tag.name in NAME_TAGS:
+            if name and model:
+                continue
+            if not name and tag.get("variant") == "caption1":
+                name = tag.get_text(strip=True)
+            elif not model and tag.get("variant") == "heading2":
+                model = tag.get_text(strip=True)
+            if not model and tag.name in ["h1", "h2"] and "model" in tag.text.lower():
+                model = tag.get_text(strip=True)
+        elif tag.name == "tr":
+            if not is_spec_row(tag):
+                continue
+            header = first_tag(tag, "th")
+            value_td = first_tag(tag, "td")
+            if header and value_td:
+                specs[header.get_text(strip=True)] = spec_value(value_td)
+        elif tag.name == "a" and brochure_link is None:
+            href = tag.get("href")
+            if href and href.endswith(".pdf"):
+                brochure_link = urljoin(base_url, href)
+    return name, model, specs, brochure_link
+
+def parse_equipment_page(html, url):
+    """Builds one table row (name, model, specs, brochure link) from a product page."""
+    soup = make_soup(html, parse_only=PAGE_PARTS)
+    name, model, specs, brochure_link = walk_equipment_page(soup, url)
+    row = {
+        "equipment_name": name,
+        "model": model,
+    }
+    row.update(specs)
+    row["brochure_link"] = brochure_link
+    return row
 
 def make_unique_column_names(keys):
     seen = {}
@@ -149,22 +182,11 @@ def scrape_volvo_equipment():
         for suffix in MODEL_SUFFIXES.get(category, []):
             url = f"{base_url}{suffix}/"
             try:
-                response = requests.get(url, timeout=10)
-                soup = BeautifulSoup(response.text, "html.parser")
-
-                name, model = extract_equipment_name_and_model(soup)
-                specs = extract_specifications(soup)
-                brochure_link = extract_brochure_link(soup, url)
-
-                row = {
-                    "equipment_name": name,
-                    "model": model,
-                }
-                row.update(specs)
-                row["brochure_link"] = brochure_link
+                response = http_client.get(url, timeout=10)
+                row = parse_equipment_page(response.text, url)
                 all_data.append(row)
 
-                print(f"[✓] Scraped {name or 'UNKNOWN'} ({model or 'UNKNOWN'})")
+                print(f"[✓] Scraped {row['equipment_name'] or 'UNKNOWN'} ({row['model'] or 'UNKNOWN'})")
 
             except Exception as e:
                 print(f"[!] Failed to scrape {url}: {e}")
@@ -0,0 +1,114 @@
+import os
+import re
+import sys
+from concurrent.futures import ThreadPoolExecutor
+
+# Make the shared modules in the repository root importable
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+import http_client
+from html_parser import make_soup
+
+BASE_URL = "http://en.xcmg.com/en-ap/ext/ajax_prolist.jsp"
+PRODUCT_SELECTOR = "li.span-4.midd-6"
+
+PREFETCH = 4  # pages kept in flight, starting with the one being processed
+MAX_PAGES = 200  # hard stop in case the end of the listing is never detected
+MAX_FAILED_PAGES = 3  # consecutive failed pages before giving up on a category
+
+
+def fetch_page(data2, page, headers):
+    """POSTs one ajax_prolist.jsp page for category data2; returns the HTML or None on failure."""
+    payload = {
+        "flag": "1",
+        "data1": "",
+        "data2": data2,
+        "data3": "",
+        "data4": "",
+        "data5": "",
+        "data6": "",
+        "nowPage": page
+    }
+    try:
+        response = http_client.post(BASE_URL, headers=headers, data=payload)
+    except Exception as e:
+        print(f"Failed to retrieve page {page}: {e}")
+        return None
+    if response.status_code != 200:
+        print(f"Failed to retrieve page {page} (status {response.status_code})")
+        return None
+    return response.text
+
+
+def find_last_page(soup):
+    """Reads the highest page number from the pager markup, or None if there is no pager."""
+    numbers = []
+    for pager in soup.select("[class*=page], [class*=Page]"):
+        if pager.select_one(PRODUCT_SELECTOR):
+            continue  # a wrapper around the listing, not the pager itself
+        for tag in pager.find_all(["a", "span", "li"]):
+            text = tag.get_text(strip=True)
+            if text.isdigit():
+                numbers.append(int(text))
+            # Links such as href="javascript:goPage(12)" or onclick="toPage(12)"
+            for value in (tag.get("onclick"), tag.get("data-page"), tag.get("href")):
+                if value and (value.isdigit() or "(" in value):
+                    match = re.search(r"(\d+)\D*$", value)
+                    if match:
+                        numbers.append(int(match.group(1)))
+        # Totals such as "1/12" or "12 pages"
+        for match in re.finditer(r"/\s*(\d+)|(\d+)\s*pages?", pager.get_text(" ", strip=True), re.I):
+            numbers.append(int(match.group(1) or match.group(2)))
+    return max(numbers) if numbers else None
+
+
+def iter_product_pages(data2, headers, prefetch=PREFETCH):
+    """Yields (page, soup) for every page of category data2 that lists products, in order.
+
+    Page 1 is read first; after it, up to `prefetch` pages are requested concurrently over
+    the shared session, bounded by the last page announced by the pager. Paging stops at
+    the first page without products, or at the announced last page when it is trustworthy
+    (the only page, or shorter than page 1); if the pager under-reports, the pages after
+    it are still probed one by one.
+    """
+    last_page = 0  # unknown until the first page is read, so that page is requested alone
+    announced = False
+    page_size = None
+    with ThreadPoolExecutor(max_workers=prefetch) as executor:
+        pending = {}
+
+        def schedule(page):
+            # Keep `prefetch` pages in flight, starting with the current one
+            for ahead in range(page, page + prefetch):
+                if ahead not in pending and ahead <= MAX_PAGES and (ahead == page or ahead <= last_page):
+                    pending[ahead] = executor.submit(fetch_page, data2, ahead, headers)
+
+        page = 1
+        failed = 0
+        schedule(page)
+        while page in pending:
+            html = pending.pop(page).result()
+            if html is None:
+                failed += 1
+                if failed >= MAX_FAILED_PAGES:
+                    print(f"Giving up on category {data2} after {failed} failed pages")
+                    break
+            else:
+                failed = 0
+                soup = make_soup(html)
+                if not last_page:
+                    announced_page = find_last_page(soup)
+                    announced = announced_page is not None
+                    last_page = announced_page or MAX_PAGES
+                products = soup.select(PRODUCT_SELECTOR)
+                if not products:
+                    break
+                if page_size is None:
+                    page_size = len(products)
+                yield page, soup
+                if announced and page == last_page and (page == 1 or len(products) < page_size):
+                    break
+            page += 1
+            schedule(page)
+
+        for future in pending.values():
+            future.cancel()
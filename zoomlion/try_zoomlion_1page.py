@@ -1,5 +1,10 @@
-import requests
-from bs4 import BeautifulSoup
+import os
+import sys
+
+# Make the shared modules in the repository root importable
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+import http_client
+from html_parser import make_soup
 
 url = "https://en-product.zoomlion.com/ext/ajax_proList.jsp"
 payload = {
@@ -13,18 +18,17 @@ payload = {
     "page_size": "6"
 }
 headers = {
-    "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/134.0.0.0 Safari/537.36",
     "X-Requested-With": "XMLHttpRequest",
     "Content-Type": "application/x-www-form-urlencoded",
     "Referer": "https://en-product.zoomlion.com/product/pro_list.htm?sCat=57",
     "Origin": "https://en-product.zoomlion.com",
 }
 
-response = requests.post(url, data=payload, headers=headers)
+response = http_client.post(url, data=payload, headers=headers)
 html_content = response.text
 
 # Parse HTML response
-soup = BeautifulSoup(html_content, "html.parser")
+soup = make_soup(html_content)
 
 # Extract product details
 products = []
@@ -0,0 +1,279 @@
+import os
+import sqlite3
+import sys
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+
+# Make the shared modules in the repository root importable
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+import http_client
+import zoomlion_specs
+
+# One pass over every Zoomlion product category. Usage:
+#   python zoomlion/zoomlion_engine.py                 # all categories, fetched concurrently
+#   python zoomlion/zoomlion_engine.py earth fdn ...   # selected categories
+#   options: --workers N
+URL = "https://en-product.zoomlion.com/ext/ajax_proList.jsp"
+LIST_URL = "https://en-product.zoomlion.com/product/pro_list.htm"
+DB_NAME = "equipment_data.db"
+
+MAX_WORKERS = 8  # listing pages in flight across all categories
+PREFETCH = 4  # pages in flight per category
+MAX_PAGES = 50  # hard stop in case an empty page never comes
+MAX_FAILED_PAGES = 3  # failed pages before giving up on a category
+
+# Categories by sCat. Spec labels listed under "labels" fill the table's existing columns;
+# any other label on a product gets a column named after the label.
+CATEGORIES = {
+    "mobilecranes": {
+        "label": "mobile crane",
+        "sCat": "54",
+        "table": "zoomlion_mobilecrane_equipment_specs",
+        "labels": zoomlion_specs.LabelTable({
+            "Max. rated lifting capacity × working": "Max. Weighted Lift Capacity",
+            "Max. load moment of main boom": "Max. Main Boom Load Moment",
+            "Max. lifting height of jib": "Max. Liftig Height of Lib",
+            "Max. load moment of basic boom": "Max. Basic Boom Load Moment",
+            "Max. lifting capacity": "Max. Lifting Capacity",
+            "Max. lifting moment": "Max. Lifting Moment",
+            "Jib length": "Jib Length",
+        }),
+    },
+    "concrete": {
+        "label": "concrete machinery",
+        "sCat": "55",
+        "table": "zoomlion_concrete_equipment_specs",
+        "labels": zoomlion_specs.LabelTable({
+            "Theoretical Rated Output": "Theoretical Rated Output",
+            "Discharge Height": "Discharge Height",
+            "The Capacity of Aggregate Storage Hopper": "The Capacity of Aggregate Storage Hopper",
+            "Maximum theorical output": "Maximum Theorical Output",
+            "Maximum theorical pressure on concrete": "Maximum Theorical Pressure on Concrete",
+            "Rated power": "Rated Power",
+            "Power": "Power",
+            "Maxiumm vertical reach": "Maxiumm Vertical Reach",
+            "Agitator Capacity": "Agitator Capacity",
+            "Max. Rotation Speed": "Max. Rotation Speed",
+            "Power Rating": "Power Rating",
+        }),
+    },
+    "towercranes": {
+        "label": "tower crane",
+        "sCat": "56",
+        "table": "zoomlion_towercrane_equipment_specs",
+        "labels": zoomlion_specs.LabelTable({
+            "Working Radius": "Working Radius",
+            "Max. Hoisting Capacity": "Max. Hoisting Capacity",
+            "Max. Free Standing Height": "Max. Free Standing Height",
+            "Max. Jib Length": "Max. Jib Length",
+            "Max. Tip Load": "Max. Tip Load",
+            "Tip Load": "Tip Load",
+            "Maximum FSH [L69]": "Maximum FSH [L69]",
+            "Maximum FSH [RB]": "Maximum FSH [RB]",
+            "Maximum Working Radius": "Maximum Working Radius",
+            "Maximum FSH [L68]": "Maximum FSH [L68]",
+            "Maximum FSH [RA]": "Maximum FSH [RA]",
+            "Max. free standing height": "Max. free standing height_2",
+            "Max. boom length": "Max. boom length",
+            "Max. hoisting capacity at jib end": "Max. hoisting capacity at jib end",
+            "Capacity": "Capacity",
+            "Speed": "Speed",
+            "Cage Size": "Cage Size",
+        }),
+    },
+    "earth": {
+        "label": "earthmoving",
+        "sCat": "57",
+        "table": "zoomlion_earthmoving_equipment_specs",
+        "labels": zoomlion_specs.LabelTable({
+            "Operating weight": "Operating Weight",
+            "Rated power": "Rated Power",
+            "Standard capacity": "Standard Capacity",
+        }),
+    },
+    "fdn": {
+        "label": "foundation",
+        "sCat": "58",
+        "table": "zoomlion_foundation_equipment_specs",
+        "labels": zoomlion_specs.LabelTable({
+            "Max. drlling diameter": "Max. Drlling Diameter",
+            "Max. drlling depth": "Max. Drlling Depth",
+            "Max. output torque": "Max. Output Torque",
+            "Rotary speed range": "Rotary Speed Range",
+            "Max. working radius": "Max. Working Radius",
+            "Max. wall depth": "Max. Wall Depth",
+            "Max. wall thickness": "Max. Wall Thickness",
+            "Max. hoisting force": "Max. Hoisting Force",
+            "Max. milling torque": "Max. Milling Torque",
+            "Max. slag discharge flow": "Max. Slag Discharge Flow",
+            "Weight of milling device": "Weight of Milling Device",
+            "Max. cutting width": "Max. Cutting Width",
+            "Max. pile pressing force": "Max. Pile Pressing Force",
+            "Min. pile pressing speed": "Min. Pile Pressing Speed",
+            "Max. pile pressing speed": "Max. Pile Pressing Speed",
+            "Max. jacking force": "Max. Jacking Force",
+            "Max. backhauling force": "Max. Backhauling Force",
+            "Max. torque": "Max. Torque",
+            "Max. rotation speed of rotary drive": "Max. Rotation Speed of Rotary Drive",
+            "Oscillating diameter": "Oscillating Diameter",
+            "Upward pressure": "Upward Pressure",
+            "Downward pressure": "Downward Pressure",
+            "Oscillating torque": "Oscillating Torque",
+            "Oscillating diamete": "Oscillating Diamete",
+            "Lifting force": "Lifting Force",
+            "Pushing stroke": "Pushing Stroke",
+            "Drilling diameter": "Drilling Diameter",
+            "Rotation torque": "Rotation Torque",
+            "Slewing speed": "Slewing Speed",
+        }),
+    },
+}
+
+
+def fetch_page(scat, page):
+    """POSTs one listing page of category scat; returns the HTML or None on failure."""
+    payload = {
+        "flag": "pro",
+        "sCat": scat,
+        "tCat": "",
+        "htzParam": "[]",
+        "key": "",
+        "chanelld": "22482",
+        "nowPage": str(page),
+        "page_size": "6"
+    }
+    headers = {
+        "X-Requested-With": "XMLHttpRequest",
+        "Content-Type": "application/x-www-form-urlencoded",
+        "Referer": f"{LIST_URL}?sCat={scat}",
+        "Origin": "https://en-product.zoomlion.com",
+    }
+    try:
+        response = http_client.post(URL, data=payload, headers=headers)
+    except Exception as e:
+        print(f"Failed to fetch sCat={scat} page {page}: {e}")
+        return None
+    if response.status_code != 200:
+        print(f"Failed to fetch sCat={scat} page {page} (status {response.status_code})")
+        return None
+    return response.text
+
+
+def parse_page(key, html):
+    return zoomlion_specs.parse_products(html, CATEGORIES[key]["labels"])
+
+
+def crawl(keys, workers=MAX_WORKERS, prefetch=PREFETCH):
+    """Fetches the listings of all categories at once; returns {key: rows in page order}.
+
+    Each category keeps up to `prefetch` pages in flight and stops at its first page
+    without products; pages fetched beyond that page are discarded.
+    """
+    pages = {key: {} for key in keys}
+    next_page = {key: 1 for key in keys}
+    last_page = {key: MAX_PAGES for key in keys}
+    failed = {key: 0 for key in keys}
+    pending = {}
+
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        def schedule(key):
+            in_flight = sum(1 for pending_key, _ in pending.values() if pending_key == key)
+            while in_flight < prefetch and next_page[key] <= last_page[key]:
+                future = executor.submit(fetch_page, CATEGORIES[key]["sCat"], next_page[key])
+                pending[future] = (key, next_page[key])
+                next_page[key] += 1
+                in_flight += 1
+
+        for key in keys:
+            schedule(key)
+        while pending:
+            done, _ = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                key, page = pending.pop(future)
+                html = future.result()
+                if page > last_page[key]:
+                    pass  # past the end of the listing
+                elif html is None:
+                    failed[key] += 1
+                    if failed[key] >= MAX_FAILED_PAGES:
+                        print(f"Giving up on Zoomlion {key} after {failed[key]} failed pages")
+                        next_page[key] = last_page[key] + 1
+                else:
+                    rows = parse_page(key, html)
+                    if rows:
+                        print(f"Fetched {key} page {page} ({len(rows)} products)")
+                        pages[key][page] = rows
+                    else:
+                        last_page[key] = min(last_page[key], page - 1)
+                schedule(key)
+
+    return {key: [row for page in sorted(pages[key]) if page <= last_page[key] for row in pages[key][page]]
+            for key in keys}
+
+
+def _quote(name):
+    return '"' + name.replace('"', '""') + '"'
+
+
+def save_category(key, rows):
+    """Writes all rows of a category in one transaction, adding columns for new labels."""
+    category = CATEGORIES[key]
+    table = category["table"]
+    if not rows:
+        print(f"No data to save for Zoomlion {key}.")
+        return
+    base_columns = ["Equipment Type", "Model"] + category["labels"].columns
+    conn = sqlite3.connect(DB_NAME)
+    try:
+        column_definitions = ", ".join(f"{_quote(column)} TEXT" for column in base_columns)
+        conn.execute(f"CREATE TABLE IF NOT EXISTS {table} (id INTEGER PRIMARY KEY AUTOINCREMENT, {column_definitions})")
+        # SQLite column names are case-insensitive: fold the labels onto the table's spelling
+        existing_columns = {col[1].lower(): col[1] for col in conn.execute(f"PRAGMA table_info({table})").fetchall()}
+        columns = {}
+        for row in rows:
+            for column in row:
+                columns.setdefault(column.lower(), existing_columns.get(column.lower(), column))
+        for folded_name, column in columns.items():
+            if folded_name not in existing_columns:
+                conn.execute(f"ALTER TABLE {table} ADD COLUMN {_quote(column)} TEXT")
+        placeholders = ", ".join("?" for _ in columns)
+        values = []
+        for row in rows:
+            folded = {column.lower(): value for column, value in row.items()}
+            values.append(tuple(folded.get(folded_name) for folded_name in columns))
+        conn.executemany(f"INSERT INTO {table} ({', '.join(_quote(column) for column in columns.values())}) VALUES ({placeholders})",
+                         values)
+        conn.commit()
+    finally:
+        conn.close()
+    print(f"Zoomlion {category['label']} data saved to {DB_NAME}, Table: {table} ({len(rows)} rows)")
+
+
+def run(keys=None, workers=MAX_WORKERS):
+    """Scrapes the given categories (all by default) in one concurrent pass, then saves each."""
+    keys = list(keys or CATEGORIES)
+    unknown = [key for key in keys if key not in CATEGORIES]
+    if unknown:
+        raise ValueError(f"Unknown Zoomlion category: {', '.join(unknown)}. Known: {', '.join(CATEGORIES)}")
+
+    for key, rows in crawl(keys, workers=workers).items():
+        try:
+            save_category(key, rows)
+        except sqlite3.Error as e:
+            print(f"Saving Zoomlion {key} failed: {e}")
+    print("Scraping complete.")
+
+
+def main(argv):
+    keys = []
+    workers = MAX_WORKERS
+    args = iter(argv)
+    for arg in args:
+        if arg == "--workers":
+            workers = int(next(args))
+        else:
+            keys.append(arg)
+    run(keys, workers=workers)
+
+
+if __name__ == "__main__":
+    main(sys.argv[1:])
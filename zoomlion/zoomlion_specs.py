@@ -0,0 +1,91 @@
+import os
+import re
+import sys
+
+# Make the shared modules in the repository root importable
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from html_parser import make_soup
+
+# Listing markup of ajax_proList.jsp
+NAME_CLASS = "tit tit22"
+CATEGORY_CLASS = "con con16"
+SPEC_LINE_CLASS = "line line01 con16"
+VALUE_CLASS = "num num01"
+
+
+class LabelTable:
+    """Spec labels ({label text: column}) compiled into one case-sensitive regex.
+
+    Each spec line is matched in a single search, whatever the number of labels. Labels are
+    tried longest first, so "Max. Tip Load" wins over "Tip Load" and "Power Rating" over "Power".
+    The column order is the order of the first label mapped to each column.
+    """
+
+    def __init__(self, labels):
+        self.labels = dict(labels)
+        self.columns = list(dict.fromkeys(self.labels.values()))
+        ordered = sorted(self.labels, key=len, reverse=True)
+        self.pattern = re.compile("|".join(re.escape(label) for label in ordered))
+
+    def match(self, text):
+        """Column for the label in one spec line, or None."""
+        found = self.pattern.search(text)
+        return self.labels[found.group()] if found else None
+
+
+def split_spec_line(spec):
+    """(label, value) of one spec line; the label is the text before the value span."""
+    value = spec.find("span", class_=VALUE_CLASS)
+    if value is None:
+        return None, None
+    label = []
+    for text in spec.find_all(string=True):
+        if any(parent is value for parent in text.parents):
+            break
+        label.append(text)
+    return " ".join("".join(label).split()).strip(" :："), value.text.strip()
+
+
+def claim_column(row, names, column):
+    """Free column of row for column; names maps lower-cased columns to their spelling in row.
+
+    Columns are compared case-insensitively (as SQLite does); a filled column gets a
+    suffixed sibling ("Capacity_2", "Capacity_3", ...) instead of being overwritten.
+    """
+    base = names.get(column.lower(), column)
+    candidate = base
+    suffix = 1
+    while row.get(names.get(candidate.lower(), candidate)) is not None:
+        suffix += 1
+        candidate = f"{base}_{suffix}"
+    return names.setdefault(candidate.lower(), candidate)
+
+
+def parse_products(html, table):
+    """Reads one listing page into rows of Equipment Type, Model and every spec on the page.
+
+    Labels known to the table fill its columns; any other label gets a column of its own
+    (as does a second label that maps to an already filled column), so nothing is dropped.
+    """
+    soup = make_soup(html)
+    products = []
+    for item in soup.find_all("li"):
+        name = item.find("div", class_=NAME_CLASS)
+        category = item.find("div", class_=CATEGORY_CLASS)
+        if not (name and category):
+            continue
+
+        row = {"Equipment Type": category.text.strip(), "Model": name.text.strip()}
+        row.update(dict.fromkeys(table.columns))
+        names = {column.lower(): column for column in row}
+        for spec in item.find_all("div", class_=SPEC_LINE_CLASS):
+            label, value = split_spec_line(spec)
+            if value is None:
+                continue
+            column = table.match(label or spec.text)
+            if column is None or row[column] is not None:
+                column = label or column
+            if column:
+                row[claim_column(row, names, column)] = value
+        products.append(row)
+    return products